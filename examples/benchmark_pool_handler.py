@@ -0,0 +1,74 @@
+"""
+Benchmark: PoolHandler scheduling
+
+Compares the completion-queue PoolHandler with the old busy-wait loop (kept below as 'BusyWaitPoolHandler'), and
+one point per task ('chunk_size=1') with the adaptive chunk size. Reports the CPU time used by the parent process (time.process_time) and the throughput.
+
+"""
+import multiprocessing
+import time
+from functools import partial
+
+from flex_optimization.core.method_subclass import temp_func
+from flex_optimization.core.utils import PoolHandler
+
+
+class BusyWaitPoolHandler(PoolHandler):
+    """ The previous implementation: polls 'ready()' over all running tasks without sleeping. """
+
+    def run(self):
+        results = []
+        with multiprocessing.Pool(self.pool_size) as pool:
+            while True:
+                if len(results) < self.pool_size and len(self.pool_points) != 0:
+                    point = self.pool_points.pop()
+                    results.append(pool.apply_async(self.func, kwds=dict(point=point)))
+
+                for i, result in enumerate(results):
+                    if result.ready():
+                        self.callback(results.pop(i).get())
+                        break
+
+                if len(self.pool_points) == 0 and len(results) == 0:
+                    break
+
+
+def objective(point: list[float], seconds: float) -> float:
+    time.sleep(seconds)  # e.g. waiting on an instrument or simulator
+    return sum(point)
+
+
+def benchmark(handler_class, seconds: float, num_points: int, pool_size: int, **kwargs) -> dict:
+    results = []
+    handler = handler_class(
+        func=partial(temp_func, func=partial(objective, seconds=seconds)),
+        pool_size=pool_size,
+        pool_points=[[float(i)] for i in range(num_points)],
+        callback=results.append,
+        **kwargs
+    )
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    handler.run()
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    assert len(results) == num_points
+
+    return dict(wall=wall, parent_cpu=cpu, parent_cpu_percent=100 * cpu / wall, throughput=num_points / wall)
+
+
+def main():
+    pool_size = 4
+    cases = (
+        ("BusyWaitPoolHandler", BusyWaitPoolHandler, {}),
+        ("PoolHandler chunk=1", PoolHandler, dict(chunk_size=1)),
+        ("PoolHandler adaptive", PoolHandler, {}),
+    )
+    for seconds, num_points in ((0.05, 200), (0.001, 2000), (0, 20000)):
+        print(f"objective: {seconds * 1000:g} ms | points: {num_points} | pool size: {pool_size}")
+        for name, handler_class, kwargs in cases:
+            r = benchmark(handler_class, seconds, num_points, pool_size, **kwargs)
+            print(f"\t{name:20} wall: {r['wall']:6.2f} s | parent CPU: {r['parent_cpu']:6.2f} s "
+                  f"({r['parent_cpu_percent']:5.1f} %) | throughput: {r['throughput']:7.1f} points/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ from flex_optimization.core.logger_ import logger
 from flex_optimization.core.visualize import VizOptimization
 
 import flex_optimization.recorders as recorders
+import flex_optimization.executors as executors
 import flex_optimization.stop_criteria as stop_criteria
 import flex_optimization.methods as methods
 import flex_optimization.problems as problems
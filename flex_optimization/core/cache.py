@@ -0,0 +1,275 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from flex_optimization.core.serialize import to_reference, to_json_value, variable_to_dict
+
+
+class EvaluationCache:
+    """
+    In-memory cache of evaluations (least recently used entries are evicted first).
+
+    Points are quantized to 'tolerance' before lookup, so points closer than the tolerance share an entry.
+    The cache lives in one process; with multiprocessing each worker has its own copy. It can be used by several
+    threads at once (e.g. 'ExecutorThread', 'ExecutorAsyncio').
+
+    Parameters
+    ----------
+    tolerance: float
+        quantization step of continuous values (0: exact match)
+    max_entries: int
+        maximum number of cached evaluations
+    max_memory: int | None
+        maximum (approximate) size of the cached keys and results in bytes
+
+    """
+    def __init__(self, tolerance: float = 0, max_entries: int = 100_000, max_memory: int | None = None):
+        self.tolerance = tolerance
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.hits = 0
+        self.misses = 0
+        self.memory = 0
+        self._entries: OrderedDict[tuple, tuple[object, int]] = OrderedDict()  # key: (result, size)
+        self._lock = threading.RLock()  # guards the entries and counters
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f"{type(self).__name__} | entries: {len(self)}; hits: {self.hits}; misses: {self.misses}; " \
+               f"hit rate: {self.hit_rate:.1%}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, point) -> bool:
+        return self.key(point) in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def bind(self, problem):
+        """ Called by the Problem the cache is attached to. """
+        pass
+
+    def key(self, point) -> tuple:
+        if isinstance(point, np.ndarray):
+            point = point.tolist()
+        elif not isinstance(point, (list, tuple)):
+            point = [point]
+        return tuple(self._quantize(value) for value in point)
+
+    def _quantize(self, value):
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+            if self.tolerance > 0:
+                return round(value / self.tolerance)
+            return float(value)  # 1 and 1.0 are the same point
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def get(self, point, func: Callable):
+        """ Cached result of 'point', or evaluate 'func(point)' and cache it. """
+        key = self.key(point)
+        hit, result = self.lookup(key)
+        if not hit:
+            result = func(point)
+            self.put(key, result)
+        return result
+
+    def lookup(self, key: tuple) -> tuple[bool, object]:
+        """ (True, result) on a hit, else (False, None); counts the hit or miss. """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return True, self._entries[key][0]
+
+            self.misses += 1
+            return False, None
+
+    def put(self, key: tuple, result):
+        size = sys.getsizeof(key) + sys.getsizeof(result)
+        with self._lock:
+            if key in self._entries:
+                self.memory -= self._entries.pop(key)[1]
+
+            self._entries[key] = (result, size)
+            self.memory += size
+            self._evict()
+
+    def put_many(self, items: list[tuple[tuple, object]]):
+        """ Add many (key, result) pairs. """
+        for key, result in items:
+            self.put(key, result)
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or \
+                (self.max_memory is not None and self.memory > self.max_memory and len(self._entries) > 1):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.memory -= size
+
+    def clear(self):
+        """ Remove all entries and reset the counters. """
+        with self._lock:
+            self._entries.clear()
+            self.memory = 0
+            self.hits = 0
+            self.misses = 0
+
+
+def problem_fingerprint(problem) -> str:
+    """ Hash of everything that determines the result of a point: 'func' (name and source), kwargs, variables. """
+    try:
+        source = inspect.getsource(problem._func)
+    except (OSError, TypeError):
+        source = ""
+
+    data = dict(
+        func=to_reference(problem._func),
+        source=source,
+        kwargs=problem.kwargs,
+        variables=[variable_to_dict(var) for var in problem.variables],
+        pass_kwargs=problem.pass_kwargs
+    )
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=to_json_value).encode()).hexdigest()
+
+
+class PersistentCache(EvaluationCache):
+    """
+    Evaluation cache stored in an SQLite file, shared by runs and processes.
+
+    Entries are keyed by a fingerprint of the problem (see 'problem_fingerprint') and the quantized point, so one
+    file can hold several problems, and changing 'func' (or its kwargs) starts a fresh set of entries.
+    Recently used entries are also kept in memory (LRU, as 'EvaluationCache').
+
+    Concurrent writers (e.g. multiprocessing workers, threads) are safe: the database uses write-ahead logging,
+    every process and thread opens its own connection, and each write is a single transaction that waits up to
+    'timeout' seconds for the lock. Results must be picklable.
+
+    Parameters
+    ----------
+    file_name: str
+        SQLite database file (created if missing)
+    fingerprint: str
+        identifies the problem (default: 'problem_fingerprint' of the problem the cache is attached to)
+    timeout: float
+        seconds to wait for a locked database
+
+    """
+    def __init__(self,
+                 file_name: str,
+                 fingerprint: str = None,
+                 tolerance: float = 0,
+                 max_entries: int = 100_000,
+                 max_memory: int | None = None,
+                 timeout: float = 30):
+        super().__init__(tolerance, max_entries, max_memory)
+        self.file_name = file_name
+        self.fingerprint = fingerprint
+        self.timeout = timeout
+        self._connections: dict[tuple[int, int], sqlite3.Connection] = {}  # (pid, thread): connection
+
+    def __getstate__(self) -> dict:
+        """ Connections can't be shared between processes, and the entries are on disk. """
+        state = super().__getstate__()
+        state["_connections"] = {}
+        state["_entries"] = OrderedDict()
+        state["memory"] = 0
+        return state
+
+    def bind(self, problem):
+        if self.fingerprint is None:
+            self.fingerprint = problem_fingerprint(problem)
+
+    @property
+    def _key_prefix(self) -> str:
+        return f"{self.fingerprint}|{self.tolerance}"
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """ Connection of the current process and thread (SQLite connections can't be shared). """
+        owner = (os.getpid(), threading.get_ident())
+        if owner not in self._connections:
+            connection = sqlite3.connect(self.file_name, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations "
+                "(fingerprint TEXT, point TEXT, result BLOB, PRIMARY KEY (fingerprint, point)) WITHOUT ROWID"
+            )
+            self._connections[owner] = connection
+        return self._connections[owner]
+
+    def __len__(self) -> int:
+        """ Number of entries on disk for this problem. """
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM evaluations WHERE fingerprint = ?", (self._key_prefix,)).fetchone()[0]
+
+    def __contains__(self, point) -> bool:
+        key = self.key(point)
+        return key in self._entries or self._read(key) is not None
+
+    def lookup(self, key: tuple) -> tuple[bool, object]:
+        with self._lock:
+            if key in self._entries:
+                return super().lookup(key)
+
+        row = self._read(key)
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+
+        result = pickle.loads(row[0])
+        super().put(key, result)
+        return True, result
+
+    def _read(self, key: tuple):
+        return self.connection.execute(
+            "SELECT result FROM evaluations WHERE fingerprint = ? AND point = ?",
+            (self._key_prefix, json.dumps(key))
+        ).fetchone()
+
+    def put(self, key: tuple, result):
+        self.put_many([(key, result)])
+
+    def put_many(self, items: list[tuple[tuple, object]]):
+        """ All items are written in one transaction. """
+        rows = [(self._key_prefix, json.dumps(key), pickle.dumps(result)) for key, result in items]
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.executemany("INSERT OR IGNORE INTO evaluations VALUES (?, ?, ?)", rows)
+
+        for key, result in items:
+            super().put(key, result)
+
+    def clear(self):
+        """ Remove the entries of this problem from memory and disk. """
+        super().clear()
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute("DELETE FROM evaluations WHERE fingerprint = ?", (self._key_prefix,))
+
+    def close(self):
+        """ Close the connections of this process. """
+        for owner in [owner for owner in self._connections if owner[0] == os.getpid()]:
+            self._connections.pop(owner).close()
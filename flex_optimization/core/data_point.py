@@ -36,7 +36,8 @@ class DataPoint:
                  point: float | int | str | list | tuple | np.ndarray,
                  result: float | int | str | list | tuple | np.ndarray,
                  metric: float | int | str | list | tuple | np.ndarray,
-                 iteration: int = None
+                 iteration: int = None,
+                 status: int = 0
                  ):
         """
 
@@ -50,6 +51,8 @@ class DataPoint:
             must be a single dimension
         iteration: int
             iteration in algorithm
+        status: int
+            'EvaluationStatus' of the evaluation (0: OK)
 
         """
         self._point = None
@@ -64,6 +67,8 @@ class DataPoint:
         self.metric = metric
 
         self.iteration = iteration
+        self.status = status
+        self.start: int | None = None  # local search of the evaluation (multi-start methods)
 
     def __repr__(self) -> str:
         mes = f" {self.point} --> {self.result}"
@@ -71,6 +76,9 @@ class DataPoint:
             mes += f" --> {self.metric}"
         return mes
 
+    def __getitem__(self, index: int | slice):
+        return self.data_chunk[index]
+
     @property
     def point(self) -> list[float | int | str]:
         return self._point
@@ -109,4 +117,6 @@ class DataPoint:
         out += self.result
         if self.has_metric:
             out += self.metric
+        if self.start is not None:
+            out.append(self.start)
         return out
@@ -0,0 +1,359 @@
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from flex_optimization.core.data_point import DataPoint
+
+
+def _is_numeric(values: list) -> bool:
+    return all(isinstance(value, (int, float, np.number)) and not isinstance(value, bool) for value in values)
+
+
+class DataStore:
+    """
+    Columnar storage of evaluations.
+
+    Each column (points, results, metrics, iterations, timestamps and, for multi-start methods, the local search
+    of each evaluation) is a numpy array which doubles in capacity when full, so appending is amortized O(1).
+    Numeric columns are stored as float64; any column that receives a non-numeric value (e.g. a string from a
+    DiscreteVariable) is converted to an object array.
+
+    Parameters
+    ----------
+    capacity: int
+        initial number of rows allocated
+
+    """
+    columns = ("points", "results", "metrics", "iterations", "timestamps", "starts")
+    _sized_by_failures = False  # only failed evaluations so far; see '_resize_failures'
+    _starts = None  # stores pickled by older versions
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = max(int(capacity), 1)
+        self._length = 0
+        self._points: np.ndarray | None = None
+        self._results: np.ndarray | None = None
+        self._metrics: np.ndarray | None = None
+        self._iterations: np.ndarray | None = None
+        self._timestamps: np.ndarray | None = None
+        self._starts: np.ndarray | None = None
+        self.has_iteration: bool | None = None
+        self.has_metric: bool | None = None
+
+    def __repr__(self):
+        return f"{type(self).__name__} | rows: {self._length}; capacity: {self._capacity}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getstate__(self) -> dict:
+        """ Only the filled rows are pickled. """
+        state = self.__dict__.copy()
+        for column in self.columns:
+            array = state.get(f"_{column}")
+            if array is not None:
+                state[f"_{column}"] = np.array(array[:self._length])
+        state["_capacity"] = max(self._length, 1)
+        return state
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self[i]
+
+    def __getitem__(self, index: int) -> DataPoint:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"DataStore index out of range: {index}")
+        index = self._physical_index(index)
+
+        iteration = int(self._iterations[index]) if self.has_iteration else None
+        metric = self._metrics[index]
+        result = self._results[index] if self.has_metric else metric
+        data_point = DataPoint(self._points[index], result, metric, iteration)
+        data_point._has_metric = self.has_metric
+        if self.has_start:
+            data_point.start = int(self._starts[index])
+        return data_point
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._column(self._points)
+
+    @property
+    def results(self) -> np.ndarray:
+        if not self.has_metric:
+            return self.metrics
+        return self._column(self._results)
+
+    @property
+    def metrics(self) -> np.ndarray:
+        return self._column(self._metrics)
+
+    @property
+    def iterations(self) -> np.ndarray:
+        return self._column(self._iterations)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._column(self._timestamps)
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self._column(self._starts)
+
+    @property
+    def has_start(self) -> bool:
+        return self._starts is not None
+
+    def arrays(self) -> dict[str, np.ndarray]:
+        """
+        Views of the filled rows of each column (results are only included if they differ from metrics, starts
+        only for multi-start methods).
+        """
+        out = dict(points=self.points, metrics=self.metrics, iterations=self.iterations, timestamps=self.timestamps)
+        if self.has_metric:
+            out["results"] = self.results
+        if self.has_start:
+            out["starts"] = self.starts
+        return out
+
+    @classmethod
+    def from_arrays(cls,
+                    points: np.ndarray,
+                    metrics: np.ndarray,
+                    iterations: np.ndarray,
+                    timestamps: np.ndarray,
+                    results: np.ndarray = None,
+                    has_iteration: bool = True,
+                    starts: np.ndarray = None):
+        """ Create a store that wraps existing (n, ...) column arrays without copying them. """
+        store = cls(capacity=len(points))
+        store._points = points
+        store._results = results
+        store._metrics = metrics
+        store._iterations = iterations
+        store._timestamps = timestamps
+        store._starts = starts
+        store._length = len(points)
+        store.has_iteration = has_iteration
+        store.has_metric = results is not None
+        return store
+
+    def _column(self, array: np.ndarray | None) -> np.ndarray:
+        if array is None:
+            return np.empty(0)
+        return array[:self._length]
+
+    def _physical_index(self, index: int) -> int:
+        """ Row in the arrays of the 'index'-th evaluation. """
+        return index
+
+    def append(self, data_point: DataPoint):
+        """ Add a single evaluation to the end of the store. """
+        if self._points is None:
+            self._setup(data_point)
+        elif self._length == self._capacity:
+            self._grow(2 * self._capacity)
+
+        self._write_row(self._length, data_point)
+        self._length += 1
+
+    def _write_row(self, i: int, data_point: DataPoint):
+        if self._sized_by_failures and not data_point.status:
+            self._resize_failures(data_point)
+        self._points = self._set_row(self._points, i, data_point.point)
+        if self.has_metric:
+            self._results = self._set_row(self._results, i, data_point.result)
+        self._metrics = self._set_row(self._metrics, i, data_point.metric)
+        self._iterations[i] = data_point.iteration if data_point.iteration is not None else -1
+        self._timestamps[i] = time.time()
+        if self.has_start:
+            self._starts[i] = data_point.start if data_point.start is not None else -1
+
+    def _setup(self, data_point: DataPoint):
+        """ Columns are sized from the first evaluation. """
+        self.has_iteration = data_point.iteration is not None
+        self.has_metric = data_point.has_metric
+        self._points = self._empty(data_point.point)
+        if self.has_metric:
+            self._results = self._empty(data_point.result)
+        self._metrics = self._empty(data_point.metric)
+        self._iterations = np.empty(self._capacity, dtype=np.int64)
+        self._timestamps = np.empty(self._capacity, dtype=np.float64)
+        if data_point.start is not None:
+            self._starts = np.empty(self._capacity, dtype=np.int64)
+        self._sized_by_failures = bool(data_point.status)
+
+    def _resize_failures(self, data_point: DataPoint):
+        """
+        Columns sized from failed evaluations (a single fill value) are resized to the first successful one:
+        results of the failed rows are NaN and their metric fill value is repeated.
+        """
+        self._sized_by_failures = False
+        if self.has_metric and len(data_point.result) != self._results.shape[1]:
+            self._results = np.full((self._capacity, len(data_point.result)), np.nan)
+        if len(data_point.metric) != self._metrics.shape[1]:
+            self._metrics = np.repeat(self._metrics[:, :1], len(data_point.metric), axis=1)
+
+    def _empty(self, values: list) -> np.ndarray:
+        dtype = np.float64 if _is_numeric(values) else object
+        return np.empty((self._capacity, len(values)), dtype=dtype)
+
+    @staticmethod
+    def _set_row(array: np.ndarray, index: int, values: list) -> np.ndarray:
+        if len(values) != array.shape[1]:
+            raise ValueError(f"Evaluation has {len(values)} values, but {array.shape[1]} were expected.")
+        if array.dtype != object and not _is_numeric(values):
+            array = array.astype(object)
+        array[index] = values
+        return array
+
+    def _grow(self, capacity: int):
+        for column in self.columns:
+            name = f"_{column}"
+            old = getattr(self, name)
+            if old is None:
+                continue
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._length] = old[:self._length]
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def column_names(self, variable_names: list[str]) -> list[str]:
+        columns = []
+        if self.has_iteration:
+            columns += ["iteration"]
+        columns += list(variable_names)
+        if self.has_metric:
+            columns += [f"inter_{i}" for i in range(self._results.shape[1])]
+        if self._metrics.shape[1] == 1:
+            columns += ["metric"]
+        else:
+            columns += [f"metric_{i}" for i in range(self._metrics.shape[1])]
+        if self.has_start:
+            columns += ["start"]
+        return columns
+
+    def to_dataframe(self, variable_names: list[str], columns: list[str] = None, rows: slice = None) \
+            -> pd.DataFrame:
+        """
+        Wraps the columns in a DataFrame without copying them.
+
+        Parameters
+        ----------
+        variable_names: list[str]
+            names of the point columns
+        columns: list[str]
+            only include these columns (other arrays are not touched, which matters for memory-mapped data)
+        rows: slice
+            only include these rows; the DataFrame index keeps the original row numbers
+
+        """
+        sources = []
+        if self.has_iteration:
+            sources.append((self._iterations, None))
+        sources += [(self._points, i) for i in range(self._points.shape[1])]
+        if self.has_metric:
+            sources += [(self._results, i) for i in range(self._results.shape[1])]
+        sources += [(self._metrics, i) for i in range(self._metrics.shape[1])]
+        if self.has_start:
+            sources.append((self._starts, None))
+
+        rows = slice(*(rows if rows is not None else slice(None)).indices(self._length))
+        data = {}
+        for name, (array, i) in zip(self.column_names(variable_names), sources):
+            if columns is not None and name not in columns:
+                continue
+            data[name] = array[rows] if i is None else array[rows, i]
+
+        index = pd.RangeIndex(rows.start, rows.stop, rows.step)
+        return pd.DataFrame(data, index=index, columns=list(data), copy=False)
+
+    def save(self, directory: str):
+        """
+        Save each column as a '.npy' file in 'directory'.
+
+        Arrays are written column-major, so a single variable is contiguous on disk and can be read from a
+        memory map without touching the others.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name, array in self.arrays().items():
+            np.save(os.path.join(directory, f"{name}.npy"), np.asfortranarray(array),
+                    allow_pickle=array.dtype == object)
+
+        with open(os.path.join(directory, "data_store.json"), "w", encoding="UTF-8") as file:
+            json.dump(dict(has_iteration=self.has_iteration, length=self._length), file)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True):
+        """
+        Load a store written by 'save'.
+
+        With 'mmap' the columns are opened as read-only memory maps; nothing is read from disk until a column
+        (or rows of it) is accessed. Object columns (e.g. strings) can not be memory-mapped and are read fully.
+        """
+        with open(os.path.join(directory, "data_store.json"), encoding="UTF-8") as file:
+            metadata = json.load(file)
+
+        arrays = {}
+        for name in cls.columns:
+            file_name = os.path.join(directory, f"{name}.npy")
+            if not os.path.exists(file_name):
+                continue
+            try:
+                arrays[name] = np.load(file_name, mmap_mode="r" if mmap else None)
+            except ValueError:  # object arrays
+                arrays[name] = np.load(file_name, allow_pickle=True)
+
+        return cls.from_arrays(has_iteration=metadata["has_iteration"], **arrays)
+
+
+class RingDataStore(DataStore):
+    """
+    Fixed-size DataStore that keeps only the last 'capacity' evaluations; the oldest row is overwritten.
+    Columns and DataFrames are returned in chronological order.
+    """
+    def __init__(self, capacity: int = 1024):
+        super().__init__(capacity)
+        self.num_appended = 0
+
+    def __getstate__(self) -> dict:
+        """ The capacity is kept, so a ring pickled before it is full still has its full size when unpickled. """
+        state = super().__getstate__()
+        state["_capacity"] = self._capacity
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        if self._points is not None and len(self._points) < self._capacity:
+            self._grow(self._capacity)  # not full yet; only the filled rows were pickled
+
+    def _physical_index(self, index: int) -> int:
+        if self.num_appended <= self._capacity:
+            return index
+        return (self.num_appended + index) % self._capacity
+
+    def _column(self, array: np.ndarray | None) -> np.ndarray:
+        if array is None or self.num_appended <= self._capacity:
+            return super()._column(array)
+        return np.roll(array, -(self.num_appended % self._capacity), axis=0)
+
+    def append(self, data_point: DataPoint):
+        if self._points is None:
+            self._setup(data_point)
+
+        self._write_row(self.num_appended % self._capacity, data_point)
+        self.num_appended += 1
+        self._length = min(self.num_appended, self._capacity)
+
+    def to_dataframe(self, variable_names: list[str], columns: list[str] = None, rows: slice = None) \
+            -> pd.DataFrame:
+        """ The index is the evaluation number (counting evaluations that have been dropped). """
+        store = DataStore.from_arrays(has_iteration=self.has_iteration, **self.arrays())
+        df = store.to_dataframe(variable_names, columns, rows)
+        df.index += self.num_appended - self._length
+        return df
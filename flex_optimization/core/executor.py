@@ -0,0 +1,189 @@
+import enum
+import queue
+from abc import ABC, abstractmethod
+
+
+class EvaluationStatus(enum.IntEnum):
+    """ Status codes of recorded evaluations (see 'Recorder.evaluation_status'). """
+    OK = 0
+    ERROR = 1  # 'problem.func' raised an exception
+    TIMEOUT = 2  # ran longer than the executor's 'timeout'
+    CRASHED = 3  # the worker process died
+
+
+class EvaluationTimeout(Exception):
+    """ An evaluation ran longer than the executor's 'timeout'. """
+
+
+class WorkerCrashed(Exception):
+    """ The worker process died during an evaluation (e.g. a segfault in native code). """
+
+
+class EvaluationFailure:
+    """
+    Result of an evaluation that failed (after all attempts). Methods record 'value' as the result and metric
+    of the point, with 'status'.
+
+    Parameters
+    ----------
+    status: EvaluationStatus
+        why it failed
+    error: Exception
+        last error
+    value:
+        recorded result and metric (NaN or a penalty)
+    attempts: int
+        number of attempts
+
+    """
+    def __init__(self, status: EvaluationStatus, error: Exception = None, value=float("nan"), attempts: int = 1):
+        self.status = status
+        self.error = error
+        self.value = value
+        self.attempts = attempts
+
+    def __repr__(self):
+        return f"EvaluationFailure | {self.status.name}; attempts: {self.attempts}; error: {self.error!r}"
+
+
+class RetryPolicy:
+    """
+    When to evaluate a failed point again.
+
+    Attempt 'n' (n >= 2) starts 'backoff * backoff_factor ** (n - 2)' seconds after the failure of attempt n - 1.
+
+    Parameters
+    ----------
+    max_attempts: int
+        attempts per point (including the first)
+    backoff: float
+        wait (s) before the second attempt
+    backoff_factor: float
+        growth of the wait for later attempts
+    exceptions: tuple[type[Exception], ...]
+        errors that are retried ('WorkerCrashed' for dead workers)
+
+    """
+    def __init__(self, max_attempts: int = 3, backoff: float = 0, backoff_factor: float = 2,
+                 exceptions: tuple[type[Exception], ...] = (Exception,)):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.exceptions = exceptions
+
+    def __repr__(self):
+        return f"RetryPolicy | max_attempts: {self.max_attempts}; backoff: {self.backoff} s x {self.backoff_factor}"
+
+    def should_retry(self, attempts: int, error: Exception) -> bool:
+        return attempts < self.max_attempts and isinstance(error, self.exceptions)
+
+    def delay(self, attempts: int) -> float:
+        """ Wait (s) after the failure of attempt 'attempts'. """
+        return self.backoff * self.backoff_factor ** (attempts - 1)
+
+
+class Executor(ABC):
+    """
+    Runs evaluations of a Problem in parallel (or not) for a method.
+
+    All parallel code paths of the methods talk to this interface, so the backend (processes, threads, inline,
+    asyncio; see 'flex_optimization.executors') can be changed with the 'executor' argument of a method.
+    An executor can be owned by one method or created by you and shared by several methods.
+
+    Use it as a context manager (or call 'close') to shut it down.
+
+    Executors with 'supports_chunks' also take chunks of points in one task ('submit_chunk'), which
+    'PoolHandler' uses to cut per-task overhead; with 'supports_shared_memory' the chunks are rows of a
+    'SharedArray' ('submit_shared').
+
+    Parameters
+    ----------
+    max_workers: int
+        number of evaluations run at the same time
+
+    """
+    supports_chunks = False
+    supports_shared_memory = False
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers if max_workers is not None else self._default_max_workers()
+        self.problem = None
+
+    def __repr__(self):
+        return f"{type(self).__name__} | max_workers: {self.max_workers}; running: {self.running}"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _default_max_workers() -> int:
+        import multiprocessing
+        return max(multiprocessing.cpu_count() - 1, 1)
+
+    @property
+    @abstractmethod
+    def running(self) -> bool:
+        ...
+
+    def start(self, problem):
+        """ Get ready to evaluate 'problem' (nothing happens if already running for it). """
+        if self.running and problem is self.problem:
+            return
+        self.close()
+        self.problem = problem
+        self._start()
+
+    @abstractmethod
+    def _start(self):
+        ...
+
+    @abstractmethod
+    def submit(self, point, callback: callable, error_callback: callable):
+        """
+        Evaluate 'point'. When done, 'callback((point, result))' or 'error_callback(exception)' is called
+        (possibly from another thread; see 'PoolHandler' for handling results in the calling thread).
+        """
+
+    def submit_chunk(self, points: list, callback: callable, error_callback: callable):
+        """
+        Evaluate 'points' in one task. When done, 'callback((pairs, elapsed))' is called with the
+        (point, result) pairs and the evaluation time (s), or 'error_callback(exception)'.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support chunks.")
+
+    def submit_shared(self, points, results, start: int, stop: int, callback: callable, error_callback: callable):
+        """
+        Evaluate rows 'start:stop' of 'points' (SharedArray (n, d)). When done, 'callback((values, elapsed))'
+        is called; 'values' is None if the (float) results were written to rows 'start:stop' of 'results'
+        (SharedArray (n,)), else the list of results.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support shared memory.")
+
+    def map(self, points: list) -> list:
+        """ Evaluate all points and return the results (in order). """
+        completed = queue.SimpleQueue()
+        for i, point in enumerate(points):
+            self.submit(
+                point,
+                callback=lambda data, i_=i: completed.put((i_, True, data[1])),
+                error_callback=lambda error, i_=i: completed.put((i_, False, error))
+            )
+
+        results = [None] * len(points)
+        for _ in range(len(points)):
+            i, successful, data = completed.get()
+            if not successful:
+                raise data
+            results[i] = data
+        return results
+
+    @abstractmethod
+    def close(self):
+        """ Let running evaluations finish and shut down. """
+
+    def terminate(self):
+        """ Stop immediately (by default the same as 'close'). """
+        self.close()
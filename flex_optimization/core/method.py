@@ -1,30 +1,148 @@
 import multiprocessing
+import os
+import pickle
 from abc import ABC, abstractmethod
 
 from flex_optimization.core.problem import Problem
 from flex_optimization.core.recorder import Recorder
+from flex_optimization.core.data_point import DataPoint
+from flex_optimization.core.executor import Executor, EvaluationFailure
 
 
 class Method(ABC):
-    def __init__(self, problem: Problem, multiprocess: bool | int = False, recorder: Recorder = None):
+    def __init__(self,
+                 problem: Problem,
+                 multiprocess: bool | int | Executor = False,
+                 recorder: Recorder = None,
+                 executor: Executor | str = None):
+        """
+        Parameters
+        ----------
+        multiprocess: bool | int | Executor
+            evaluate in parallel processes (True: cpu count - 1; int: number of processes)
+            * with 'executor' as a string it sets the number of workers
+            * Executor (e.g. a shared 'WorkerPool'): same as passing it as 'executor'
+        executor: Executor | str
+            backend for parallel evaluations
+            * Executor: use this one (it can be shared by several methods)
+            * 'process', 'thread', 'inline', 'asyncio': create one for this method
+            (see 'flex_optimization.executors')
+            The method keeps the executor it creates running between runs/steps; use the method as a context
+            manager (or call 'close') to shut it down.
+
+        """
         self.problem = problem
         self.recorder = self._get_recorder(recorder)
+        if isinstance(multiprocess, Executor) and executor is None:
+            multiprocess, executor = True, multiprocess
         self.multiprocess = multiprocess
+        self.executor = executor
+        self._executor: Executor | None = None  # executor owned by this method
 
         self.recorder.record(self.recorder.SETUP)
 
     def __repr__(self):
         return f"{type(self).__name__}"
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def parallel(self) -> bool:
+        """ True if evaluations go through an executor. """
+        return bool(self.multiprocess) or self.executor is not None
+
+    def close(self):
+        """ Shut down the executor owned by this method (a shared executor passed in is left running). """
+        if self._executor is not None:
+            self._executor.close()
+            self._executor = None
+
     @abstractmethod
     def run(self):
         ...
 
+    def save_checkpoint(self, file_name: str):
+        """
+        Save the state of the method (problem, recorder, stop criteria, sampler, counters) to
+        '<file_name>.checkpoint'. The file is replaced atomically, so an interrupted write keeps the prior checkpoint.
+        The evaluations recorded since the last checkpoint are appended to '<file_name>.checkpoint.rows', so a
+        checkpoint costs the new evaluations, not all of them (recorders with bounded data are saved whole).
+        * 'problem.func' and 'problem.metric' need to be picklable (e.g. module-level functions)
+        """
+        recorder = self.recorder
+        swapped = recorder._save_checkpoint_rows(file_name)
+        kept = {name: getattr(recorder, name) for name in swapped}
+        recorder.__dict__.update(swapped)
+        temp_file_name = f"{file_name}.checkpoint.tmp"
+        try:
+            with open(temp_file_name, "wb") as file:
+                pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file_name, f"{file_name}.checkpoint")
+        except BaseException:
+            if os.path.exists(temp_file_name):
+                os.remove(temp_file_name)  # e.g. something that can't be pickled; the prior checkpoint is kept
+            raise
+        finally:
+            recorder.__dict__.update(kept)
+        recorder._checkpoint_rows = swapped.get("_checkpoint_rows", recorder._checkpoint_rows)
+
+    @classmethod
+    def resume(cls, file_name: str, run: bool = True):
+        """
+        Load a method from '<file_name>.checkpoint' and (if 'run') continue the optimization where it stopped.
+
+        Returns
+        -------
+        method: Method
+            the restored method
+        """
+        with open(f"{file_name}.checkpoint", "rb") as file:
+            method = pickle.load(file)
+
+        method.recorder._load_checkpoint_rows()
+        method.recorder._resume()
+        method.recorder.record(method.recorder.NOTES,
+                               text=f"Resumed from checkpoint '{file_name}' ({method.recorder.num_data_points} "
+                                    f"evaluations recorded).")
+        if run:
+            method.run()
+        return method
+
     def _get_pool_size(self) -> int:
         if self.multiprocess > 1:
             return self.multiprocess
 
-        return multiprocessing.cpu_count() - 1
+        return max(multiprocessing.cpu_count() - 1, 1)
+
+    def _get_executor(self) -> Executor:
+        """ Running executor for the problem (created on first use, then reused). """
+        if isinstance(self.executor, Executor):
+            executor = self.executor
+        else:
+            if self._executor is None:
+                from flex_optimization.executors import executors
+                name = self.executor or ("asyncio" if self.problem.is_async else "process")
+                self._executor = executors[name](self._get_pool_size() if self.multiprocess else None)
+            executor = self._executor
+
+        executor.start(self.problem)
+        return executor
+
+    def _to_data_point(self, point, result, iteration: int = None) -> DataPoint:
+        """
+        DataPoint of an evaluation done by the executor. Failed evaluations ('EvaluationFailure') get the failure
+        value as result and metric, and their status; the recorder fills the row to the width of the results.
+        """
+        if not isinstance(result, EvaluationFailure):
+            return DataPoint(point, result, self.problem.metric(result), iteration)
+
+        data_point = DataPoint(point, result.value, result.value, iteration, status=result.status)
+        data_point._has_metric = self.problem._metric is not None
+        return data_point
 
     def _get_recorder(self, recorder: Recorder | None) -> Recorder:
 
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.problem import Problem
 from flex_optimization.core.method import Method
 from flex_optimization.core.stop_criteria import StopCriteria
 from flex_optimization.core.data_point import DataPoint
+from flex_optimization.core.logger_ import logger
 from flex_optimization.core.utils import save_if_error
 
 
@@ -14,9 +16,18 @@ def temp_func(func, point):
 
 
 class PassiveMethod(Method, ABC):
-    def __init__(self, problem: Problem, multiprocess: bool | int = False, recorder: Recorder = None):
+    def __init__(self,
+                 problem: Problem,
+                 multiprocess: bool | int = False,
+                 recorder: Recorder = None,
+                 executor: Executor | str = None):
         self.number_points = None
-        super().__init__(problem, multiprocess, recorder)
+        super().__init__(problem, multiprocess, recorder, executor=executor)
+
+    @property
+    def parallel(self) -> bool:
+        """ Coroutine functions are evaluated concurrently (with 'ExecutorAsyncio' unless an executor is set). """
+        return super().parallel or self.problem.is_async
 
     @abstractmethod
     def get_points(self):
@@ -30,7 +41,7 @@ class PassiveMethod(Method, ABC):
         self.number_points = len(points)
         self.recorder.record(self.recorder.NOTES, text=f"\tNumber of evaluations to preform: {self.number_points}")
 
-        if self.multiprocess >= 1:
+        if self.parallel:
             self._run_multiprocessing(points)
         else:
             self._run_single(points)
@@ -38,25 +49,29 @@ class PassiveMethod(Method, ABC):
         self.recorder.record(self.recorder.FINISH)
 
     def _run_single(self, points: list[list[int | float | str]]):
+        if self.problem.vectorized:
+            self._run_batch(points)
+            return
+
         for point in points:
             result = self.problem.evaluate(point)
             metric = self.problem.metric(result)
             self.recorder.record(self.recorder.EVALUATION, data_point=DataPoint(point, result, metric))
 
+    def _run_batch(self, points: list[list[int | float | str]]):
+        """ All points in one call to 'func' and one call to 'metric'. """
+        results = self.problem.evaluate_batch(points)
+        metrics = self.problem.metric_batch(results)
+        for point, result, metric in zip(points, results, metrics):
+            self.recorder.record(self.recorder.EVALUATION, data_point=DataPoint(point, result, metric))
+
     def _run_multiprocessing(self, points):
         def callback(results):
             point_, result = results
-            metric = self.problem.metric(result)
-            self.recorder.record(self.recorder.EVALUATION, data_point=DataPoint(point_, result, metric))
+            self.recorder.record(self.recorder.EVALUATION, data_point=self._to_data_point(point_, result))
 
-        from functools import partial
         from flex_optimization.core.utils import PoolHandler
-        pool = PoolHandler(
-            func=partial(temp_func, func=self.problem.evaluate),
-            pool_size=self._get_pool_size(),
-            pool_points=points,
-            callback=callback
-        )
+        pool = PoolHandler(executor=self._get_executor(), pool_points=points, callback=callback)
         pool.run()
 
 
@@ -66,17 +81,36 @@ class ActiveMethod(Method, ABC):
                  problem: Problem,
                  stop_criterion: StopCriteria | list[StopCriteria] | list[list[StopCriteria]],
                  multiprocess: bool | int = False,
-                 recorder: Recorder = None):
+                 recorder: Recorder = None,
+                 executor: Executor | str = None):
         if not isinstance(stop_criterion, list):
             stop_criterion = [stop_criterion]
         self.stop_criterion: list[StopCriteria] = stop_criterion
         self.iteration_count = 0
         self._flag_init = False  # False = Not initialized
-        super().__init__(problem, multiprocess, recorder)
+        self.checkpoint_file: str | None = None
+        self.checkpoint_every: int = 100
+        super().__init__(problem, multiprocess, recorder, executor=executor)
 
     def method_init(self):
         self._flag_init = True
 
+    def enable_checkpoints(self, file_name: str, every: int = 100):
+        """
+        Save a checkpoint every 'every' iterations (and when an error occurs).
+        Continue a run with 'Method.resume(file_name)'.
+        """
+        self.checkpoint_file = file_name
+        self.checkpoint_every = every
+
+    def _checkpoint_step(self):
+        """ Save a checkpoint every 'checkpoint_every' iterations; a failed checkpoint doesn't stop the run. """
+        if self.checkpoint_file is not None and self.iteration_count % self.checkpoint_every == 0:
+            try:
+                self.save_checkpoint(self.checkpoint_file)
+            except Exception as e:
+                logger.warning(f"Checkpoint could not be saved (iteration {self.iteration_count}): {e!r}")
+
     @abstractmethod
     def get_point(self):
         pass
@@ -106,11 +140,17 @@ class ActiveMethod(Method, ABC):
         if not self._flag_init:
             self.method_init()
 
-        if self.multiprocess:
+        if self.parallel:
             self._multi_run_step(algo_steps)
             return
+        if self.problem.vectorized:
+            self._batch_run_step(algo_steps)
+            return
 
-        # main optimization loop
+        self._single_run_step(algo_steps)
+
+    def _single_run_step(self, algo_steps: int):
+        """ main optimization loop """
         for _ in range(algo_steps):
             self.iteration_count += 1
             point = self.get_point()
@@ -119,11 +159,16 @@ class ActiveMethod(Method, ABC):
             self._tell(DataPoint(point, result, metric, self.iteration_count))
             if not self._check_stop_criterion():
                 break
+            self._checkpoint_step()
 
     def _multi_run_step(self, step: int):
         """ Sub-classed for multiprocessing capabilities. """
         raise NotImplementedError("Multi-processing not implemented yet.")
 
+    def _batch_run_step(self, step: int):
+        """ Sub-classed to use 'problem.evaluate_batch'; by default points are evaluated one at a time. """
+        self._single_run_step(step)
+
     def _tell(self, data_point: DataPoint):
         """ Update optimizer with new values"""
         self.recorder.record(self.recorder.EVALUATION, data_point=data_point)
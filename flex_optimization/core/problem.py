@@ -1,11 +1,28 @@
+import asyncio
+import inspect
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
+import numpy as np
+
 from flex_optimization import OptimizationType
+from flex_optimization.core.cache import EvaluationCache
 from flex_optimization.core.data_point import DataPoint
 from flex_optimization.core.variable import Variable, DiscreteVariable, ContinuousVariable
 
 
+def _run_coroutine(coroutine):
+    """ Run 'coroutine' to completion; in a thread of its own if this thread already runs an event loop (Jupyter). """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(1, thread_name_prefix="flex_optimization-coroutine") as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
 class Problem(ABC):
 
     def __init__(self,
@@ -14,7 +31,9 @@ class Problem(ABC):
                  kwargs: dict = None,
                  metric: Callable = None,
                  type_: OptimizationType = OptimizationType.MIN,
-                 pass_kwargs: bool = False):
+                 pass_kwargs: bool = False,
+                 vectorized: bool = False,
+                 cache: EvaluationCache | bool = None):
         """
 
         Parameters
@@ -22,6 +41,8 @@ class Problem(ABC):
         func: Callable
             function to be evaluated
             must return int, float, list[int|float], tuple[int, float]
+            * can be a coroutine function ('async def'); passive methods and samplers then keep several
+                evaluations in flight (see 'ExecutorAsyncio'), other methods run it to completion each call
         variables: list[Variable] | tuple[Variable]
             variables
         kwargs: dict
@@ -30,6 +51,15 @@ class Problem(ABC):
             calculation of optimization metrics from function output
         type_: OptimizationType
             type of optimization
+        vectorized: bool
+            'func' also accepts an (n, d) array of points and returns n results (an array (n,) or (n, m),
+            or a tuple/list of m arrays (n,)); 'metric' (if given) must then accept the results in the same layout
+            as for a single point, but with an array (n,) in place of each value.
+            Passive methods and samplers evaluate whole batches with 'evaluate_batch'.
+        cache: EvaluationCache | bool
+            re-use results of points that were already evaluated (True: 'EvaluationCache()' with default settings)
+            * cache hits are still recorded as evaluations
+            * 'PersistentCache' keeps results on disk across runs and processes
 
         """
         self._func = func
@@ -38,6 +68,12 @@ class Problem(ABC):
         self.variables = variables
         self.type_ = type_
         self.pass_kwargs = pass_kwargs
+        self.vectorized = vectorized
+        if cache is True:
+            cache = EvaluationCache()
+        self.cache: EvaluationCache | None = cache if isinstance(cache, EvaluationCache) else None
+        if self.cache is not None:
+            self.cache.bind(self)
         self._temp_data: list[DataPoint] = []
 
     def __repr__(self):
@@ -62,12 +98,47 @@ class Problem(ABC):
     def func(self, *args, **kwargs):
         return self._func(*args, **kwargs)
 
+    @property
+    def is_async(self) -> bool:
+        """ True if 'func' is a coroutine function. """
+        return inspect.iscoroutinefunction(self._func)
+
     def evaluate(self, *args, **kwargs):
+        if self.cache is not None and len(args) == 1 and not kwargs:
+            return self.cache.get(args[0], self._evaluate)
+        return self._evaluate(*args, **kwargs)
+
+    def _evaluate(self, *args, **kwargs):
+        args_, kwargs_ = self._func_args(args, kwargs)
+        result = self.func(*args_, **kwargs_)
+        if inspect.isawaitable(result):
+            return _run_coroutine(result)  # coroutine function called synchronously
+        return result
+
+    async def evaluate_async(self, *args, **kwargs):
+        """ 'evaluate' for coroutine functions: 'func' is awaited (cache hits return right away). """
+        use_cache = self.cache is not None and len(args) == 1 and not kwargs
+        if use_cache:
+            key = self.cache.key(args[0])
+            hit, result = self.cache.lookup(key)
+            if hit:
+                return result
+
+        args_, kwargs_ = self._func_args(args, kwargs)
+        result = self.func(*args_, **kwargs_)
+        if inspect.isawaitable(result):
+            result = await result
+
+        if use_cache:
+            self.cache.put(key, result)
+        return result
+
+    def _func_args(self, args: tuple, kwargs: dict) -> tuple[tuple, dict]:
+        """ Positional and keyword arguments for 'func'. """
         if self.pass_kwargs:
             kwargs = kwargs | self._args_to_kwargs(*args)
             args = ()
-        kwargs_ = self.kwargs | kwargs
-        return self.func(*args, **kwargs_)
+        return args, self.kwargs | kwargs
 
     def _args_to_kwargs(self, args) -> dict:
         out = {}
@@ -75,15 +146,67 @@ class Problem(ABC):
             out[key] = arg
         return out
 
-    # def evaluate_multi(self, points: list | list[list], **kwargs) -> list:
-    #     result = []
-    #     for point in points:
-    #         result = self.func(point, **kwargs, **self.kwargs)
-    #     return result
+    def evaluate_batch(self, points: np.ndarray | list[list], **kwargs) -> np.ndarray | list:
+        """
+        Evaluate many points.
+
+        Parameters
+        ----------
+        points: np.ndarray | list[list]
+            (n, d) points
+
+        Returns
+        -------
+        results: np.ndarray | list
+            * vectorized: array (n,) or (n, m)
+            * else: list of the n results
+
+        """
+        if not self.vectorized:
+            return [self.evaluate(point, **kwargs) for point in points]
+        if self.cache is not None and not kwargs:
+            return self._evaluate_batch_cached(points)
+        return self._evaluate_batch(points, **kwargs)
+
+    def _evaluate_batch_cached(self, points) -> np.ndarray:
+        """ Only the points not in the cache are passed to 'func'. """
+        keys = [self.cache.key(point) for point in points]
+        results = [self.cache.lookup(key) for key in keys]
+        missing = [i for i, (hit, _) in enumerate(results) if not hit]
+        if missing:
+            new_results = self._evaluate_batch([points[i] for i in missing])
+            self.cache.put_many([(keys[i], result) for i, result in zip(missing, new_results)])
+            for i, result in zip(missing, new_results):
+                results[i] = (True, result)
+
+        return np.asarray([result for _, result in results])
+
+    def _evaluate_batch(self, points, **kwargs) -> np.ndarray:
+        points = np.asarray(points)
+        if self.pass_kwargs:
+            results = self._evaluate(points.T, **kwargs)  # one array (n,) per variable
+        else:
+            results = self._evaluate(points, **kwargs)
+
+        if isinstance(results, (tuple, list)):
+            return np.column_stack(results)
+        return np.asarray(results)
+
+    def metric_batch(self, results: np.ndarray | list) -> np.ndarray | list:
+        """ Metrics of the results of 'evaluate_batch'; one call to 'metric' if vectorized. """
+        if not self.vectorized:
+            return [self.metric(result) for result in results]
+        if self._metric is None:
+            return results
+
+        metrics = np.asarray(self.metric(results.T))  # same layout as a single result, with arrays as values
+        if metrics.ndim == 2:
+            return metrics.T
+        return metrics
 
     def evaluate_capture(self, *args, **kwargs):
         # TODO: added because scipy doesn't allow intermittent values, fix scipy callback
-        result = self.evaluate(*args, **kwargs, **self.kwargs)  # _func
+        result = self.evaluate(*args, **kwargs)  # _func
         metric = self.metric(result)
         self._temp_data.append(DataPoint(*args, result, metric))
         return metric
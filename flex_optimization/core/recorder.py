@@ -1,13 +1,22 @@
-import copy
+import heapq
+import inspect
+import json
+import os
+import pickle
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
 
 from flex_optimization import OptimizationType
+from flex_optimization.core.serialize import to_reference, from_reference, to_json_value, attributes_to_dict, \
+    attributes_from_dict, problem_to_dict, problem_from_dict, method_to_dict, method_from_dict
 from flex_optimization.core.data_point import DataPoint
+from flex_optimization.core.data_store import DataStore
 
 
 class Recorder(ABC):
+    bounded_data = False  # True if 'data' only holds a bounded number of evaluations (pickled whole in checkpoints)
     SETUP = 0
     RUNNING = 1
     EVALUATION = 2
@@ -17,51 +26,212 @@ class Recorder(ABC):
     WARNING = 6
     ERROR = 7
 
-    def __init__(self, problem=None, method=None):
+    def __init__(self, problem=None, method=None, top_k: int = 10):
         self.problem = problem
         self.method = method
-        self.data: list[DataPoint] = []
+        self.data = DataStore()
+        self.num_data_points: int = 0
         self._df = None
-        self._best_result = None
-        self._up_to_date = False
+        self._df_length = 0
+        self._best_index: int | None = None
+        self._best_metric: float | None = None
+        self._best_data_point: DataPoint | None = None
+        self._last_metric: float | None = None
+        self.top_k_size = top_k
+        self._top_k_heap: list[tuple[float, int, DataPoint]] = []  # root is the worst of the kept evaluations
         self._error = None
         self._multiprocessing = False
+        self.evaluation_status: dict[int, int] = {}  # index: 'EvaluationStatus' of failed evaluations
+        self._row_widths: tuple[int, int] | None = None  # result and metric widths of successful evaluations
+        self._checkpoint_rows: tuple[str, int, int] | None = None  # rows file, rows and bytes in the last checkpoint
 
     def _error_exit(self, e):
         """ Here to do something if error occurs during optimization. """
         raise e
 
+    def _resume(self):
+        """ Here to do something when the method is restored from a checkpoint. """
+        pass
+
+    def _save_checkpoint_rows(self, file_name: str) -> dict:
+        """
+        Append the evaluations recorded since the last checkpoint to '<file_name>.checkpoint.rows'.
+
+        Returns the attributes to swap in while the recorder is pickled into the checkpoint, so the checkpoint
+        itself doesn't hold the evaluations ('_load_checkpoint_rows' reads them back on resume).
+        """
+        if self.bounded_data:
+            return {}
+
+        rows_file = f"{file_name}.checkpoint.rows"
+        saved_file, rows, size = self._checkpoint_rows or (None, 0, 0)
+        if saved_file != rows_file or not os.path.exists(rows_file):
+            rows, size = 0, 0
+        with open(rows_file, "r+b" if size else "wb") as file:
+            file.seek(size)
+            file.truncate()  # rows of a checkpoint that wasn't completed
+            if len(self.data) > rows:
+                chunk = {name: array[rows:] for name, array in self.data.arrays().items()}
+                chunk["has_iteration"] = self.data.has_iteration
+                pickle.dump(chunk, file, protocol=pickle.HIGHEST_PROTOCOL)
+            size = file.tell()
+
+        return dict(data=DataStore(), _df=None, _df_length=0, _checkpoint_rows=(rows_file, len(self.data), size))
+
+    def _load_checkpoint_rows(self):
+        """ Read the evaluations of the checkpoint back from the rows file (rows written after it are ignored). """
+        if self._checkpoint_rows is None:
+            return
+
+        rows_file, rows, size = self._checkpoint_rows
+        chunks = []
+        with open(rows_file, "rb") as file:
+            while file.tell() < size:
+                chunks.append(pickle.load(file))
+        if rows == 0:
+            return
+
+        has_iteration = chunks[0].pop("has_iteration")
+        columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+        self.data = DataStore.from_arrays(has_iteration=has_iteration, **columns)
+
+    @property
+    def best_result(self) -> dict:
+        if self._best_data_point is None:
+            return self._get_best_result()  # loaded data; no running best available
+
+        return dict(zip(self._get_dataframe_column_names(), self._best_data_point.data_chunk))
+
+    @property
+    def best_metric(self) -> float | None:
+        """ Best metric recorded so far (None if nothing has been recorded). """
+        return self._best_metric
+
+    @property
+    def last_metric(self) -> float | None:
+        """ Metric of the latest evaluation (None if nothing has been recorded); kept by every recorder. """
+        return self._last_metric
+
     @property
-    def best_result(self):
-        if not self._up_to_date:
-            self._best_result = self._get_best_result()
-            self._up_to_date = True
+    def best_index(self) -> int | None:
+        """ Row index of the best evaluation in 'self.data'. """
+        return self._best_index
 
-        return self._best_result
+    def top_k(self, k: int = None) -> list[dict]:
+        """
+        The 'k' best evaluations, best first.
+
+        Parameters
+        ----------
+        k: int
+            number of evaluations to return (default is 'top_k_size')
+            * if larger than 'top_k_size' the full DataFrame is sorted instead
+
+        """
+        if k is None:
+            k = self.top_k_size
+        if k > self.top_k_size or (len(self._top_k_heap) == 0 and self._df is not None):
+            ascending = self.problem.type_ != OptimizationType.MAX
+            return self.df.sort_values("metric", ascending=ascending, kind="stable").head(k).to_dict("records")
+
+        columns = self._get_dataframe_column_names()
+        leaders = heapq.nlargest(k, self._top_k_heap, key=lambda entry: entry[:2])
+        return [dict(zip(columns, data_point.data_chunk)) for _, _, data_point in leaders]
+
+    def _store_data_point(self, data_point: DataPoint):
+        """ Add evaluation to the data store and update the running best and top-k. """
+        if data_point.status:
+            self._fit_failure(data_point)
+        elif self._row_widths is None:
+            self._row_widths = (len(data_point.result), len(data_point.metric))
+        self.data.append(data_point)
+        self._last_metric = data_point.metric[0]
+        if data_point.status:
+            self.evaluation_status[self.num_data_points] = int(data_point.status)
+        else:
+            self._update_incumbents(self.num_data_points, data_point)
+        self.num_data_points += 1
+
+    def _fit_failure(self, data_point: DataPoint):
+        """ A failed evaluation (a single fill value) gets NaN results and the fill value as metric(s). """
+        if self._row_widths is None:
+            return  # no successful evaluation yet; the data store resizes the rows once there is one
+        result_width, metric_width = self._row_widths
+        fill = data_point.metric[0]
+        data_point.result = [float("nan")] * result_width
+        data_point.metric = [fill] * metric_width
+
+    def _update_incumbents(self, index: int, data_point: DataPoint):
+        metric = data_point.metric[0]
+        if metric != metric:
+            return  # NaN
+
+        if self._is_better(metric, self._best_metric):
+            self._best_index = index
+            self._best_metric = metric
+            self._best_data_point = data_point
+
+        if self.top_k_size > 0:
+            # heap is keyed so larger is better; ties go to the earlier evaluation
+            score = metric if self.problem.type_ == OptimizationType.MAX else -metric
+            entry = (score, -index, data_point)
+            if len(self._top_k_heap) < self.top_k_size:
+                heapq.heappush(self._top_k_heap, entry)
+            elif entry[:2] > self._top_k_heap[0][:2]:
+                heapq.heapreplace(self._top_k_heap, entry)
+
+    def _is_better(self, metric, other) -> bool:
+        """ True if 'metric' is better than 'other' for this problem. NaN is never better. """
+        if metric != metric:
+            return False
+        if other is None:
+            return True
+        if self.problem.type_ == OptimizationType.MAX:
+            return metric > other
+        return metric < other
 
     @property
     def df(self) -> pd.DataFrame:
-        if self._df is None:
+        """
+        DataFrame of all evaluations.
+
+        The frame is a view on the columns of 'self.data', so it is only re-wrapped (not re-built) when new
+        evaluations have been recorded since the last access.
+        """
+        if self._df is None or self._df_length < len(self.data):
             if len(self.data) == 0:
                 raise Exception("Error occurred. No data present to generate data frame. "
                                 "Did you forget to 'run' the optimization?")
-            columns = self._get_dataframe_column_names()
-            data = [dat.data_chunk for dat in self.data]
-            self._df = pd.DataFrame(data, columns=columns)
+            self._df = self.data.to_dataframe(self.problem.variable_names)
+            self._df_length = len(self.data)
 
         return self._df
 
+    def get_df(self, columns: list[str] = None, rows: slice = None) -> pd.DataFrame:
+        """
+        DataFrame of a subset of columns and/or rows.
+
+        Only the requested columns are wrapped, so for data loaded memory-mapped only those columns (and rows)
+        are read from disk.
+        """
+        data = self.read_data()
+        if len(data) == 0:  # data loaded from csv
+            df = self.df if columns is None else self.df[columns]
+            return df if rows is None else df.iloc[rows]
+
+        return data.to_dataframe(self.problem.variable_names, columns, rows)
+
+    def read_data(self) -> DataStore:
+        """ All evaluations as a single DataStore. """
+        return self.data
+
     def _get_dataframe_column_names(self) -> list[str]:
-        columns = []
-        if self.data[0].iteration is not None:
-            columns += ["iteration"]
-        columns += self.problem.variable_names
-        if self.data[0].has_metric:
-            columns += [f"inter_{i}" for i in range(len(self.data[0].result))]
-        columns += ["metric"]
-        return columns
+        return self.data.column_names(self.problem.variable_names)
 
     def _get_best_result(self):
+        if self.df["metric"].isna().all():
+            return None  # no evaluation has a metric
+
         if self.problem.type_ == OptimizationType.MAX:
             best_result_index = self.df["metric"].idxmax()
         else:
@@ -72,38 +242,111 @@ class Recorder(ABC):
     @abstractmethod
     def record(self, type_: int, *args, **kwargs):
         ...
-        # self._up_to_date = False  # add to recorder.EVALUATION
+        # self._store_data_point(data_point)  # add to recorder.EVALUATION
 
-    def save(self, file_name: str):
-        self.df.to_csv(f"{file_name}.csv")
-        self._save_self(file_name)
+    def save(self, file_name: str, format_: str = "npy"):
+        """
+        Save data and a JSON description of the recorder, problem and method.
 
-    def _save_self(self, file_name):
-        import pickle
-        obj = copy.copy(self)
-        del obj.data
-        del obj._df
-        delete_list = [[obj.method, "optimizer"], [obj.problem, "func"], [obj, "method"], [obj.problem, "metric"]]
-
-        for att in delete_list:
-            try:
-                with open(f"{file_name}.pickle", "wb") as file:
-                    pickle.dump(obj, file)
-            except:
-                if hasattr(att[0], att[1]):
-                    print(f"item {att[0]}.{att[1]} was dropped in attempt to save data.")
-                    delattr(att[0], att[1])
-                continue
-            break
+        Functions and classes (e.g. 'problem.func') are saved as references ('module:qualified_name') and re-imported
+        by 'load'; you get a warning if that is not possible (e.g. for lambdas or functions defined in functions).
+        Problem 'kwargs' that are not JSON-able are not saved (with a warning); pass them again after loading.
+
+        Parameters
+        ----------
+        file_name: str
+            file name (without extension)
+        format_: str
+            * "npy": folder '<file_name>' with one binary file per column and 'recorder.json';
+                'load' opens it memory-mapped
+            * "csv": text files '<file_name>.csv' and '<file_name>.json'
+
+        """
+        if format_ == "npy":
+            self.read_data().save(file_name)
+            metadata_file = os.path.join(file_name, "recorder.json")
+        elif format_ == "csv":
+            self.df.to_csv(f"{file_name}.csv")
+            metadata_file = f"{file_name}.json"
+        else:
+            raise ValueError(f"Invalid format_: {format_}. Options: 'npy', 'csv'")
+
+        with open(metadata_file, "w", encoding="UTF-8") as file:
+            json.dump(self._get_metadata(), file, indent=2, default=to_json_value)
+
+    _not_saved = ("problem", "method", "data", "_df", "_df_length", "_error", "_best_index", "_best_metric",
+                  "_best_data_point", "_top_k_heap", "_last_metric", "_checkpoint_rows")
+
+    def _get_metadata(self) -> dict:
+        attributes, not_saved = attributes_to_dict(self, exclude=self._not_saved)
+        return dict(
+            recorder=dict(
+                class_=to_reference(type(self)),
+                attributes=attributes,
+                error=repr(self._error) if self._error is not None else None,
+                not_saved=not_saved
+            ),
+            problem=problem_to_dict(self.problem),
+            method=method_to_dict(self.method) if self.method is not None else None
+        )
 
     @classmethod
-    def load(cls, file_name: str):
-        import pickle
-        with open(f"{file_name}.pickle", "rb") as file:
-            obj = pickle.load(file)
+    def _from_metadata(cls, metadata: dict):
+        recorder_class = cls if not inspect.isabstract(cls) else from_reference(metadata["recorder"]["class_"])
+        obj = recorder_class.__new__(recorder_class)
+        Recorder.__init__(obj, problem_from_dict(metadata["problem"]))
+        obj.__dict__.update(attributes_from_dict(metadata["recorder"]["attributes"]))
+        obj._error = metadata["recorder"]["error"]
+        obj.evaluation_status = {int(k): v for k, v in obj.__dict__.get("evaluation_status", {}).items()}  # json keys
+        if metadata["method"] is not None:
+            obj.method = method_from_dict(metadata["method"], obj.problem, obj)
+        return obj
 
-        csv_ = pd.read_csv(f"{file_name}.csv", index_col=0)
-        obj._df = csv_
+    def _rebuild_incumbents(self):
+        """ Find the best and top-k evaluations of loaded data (one vectorized pass over the metric column). """
+        if len(self.data) == 0:
+            return
+
+        self._last_metric = self.data[-1].metric[0]
+        metrics = np.asarray(self.data.metrics[:, 0], dtype=np.float64)
+        scores = metrics if self.problem.type_ == OptimizationType.MAX else -metrics
+        scores = np.where(np.isnan(scores), -np.inf, scores)
+        offset = self.num_data_points - len(self.data)  # evaluations dropped by bounded recorders
+        failed = [index - offset for index in self.evaluation_status if index >= offset]
+        scores[failed] = -np.inf
+        k = min(max(self.top_k_size, 1), len(scores))
+        indexes = np.argpartition(-scores, k - 1)[:k]
+        entries = sorted(((scores[i], -int(i)) for i in indexes), reverse=True)
+
+        best_score, best_index = entries[0]
+        if best_score != -np.inf:
+            self._best_index = -best_index
+            self._best_data_point = self.data[self._best_index]
+            self._best_metric = self._best_data_point.metric[0]
+        if self.top_k_size > 0:
+            self._top_k_heap = [(score, index, self.data[-index]) for score, index in entries if score != -np.inf]
+            heapq.heapify(self._top_k_heap)
+
+    @classmethod
+    def load(cls, file_name: str, mmap: bool = True):
+        """
+        Load data saved with 'save'.
+
+        Binary ('npy') data is opened memory-mapped (unless 'mmap' is False); use 'get_df' to only read the columns
+        and rows needed.
+        """
+        if os.path.exists(f"{file_name}.pickle"):
+            obj = cls._load_pickle(file_name)  # saved by older versions
+        elif os.path.isdir(file_name):
+            with open(os.path.join(file_name, "recorder.json"), encoding="UTF-8") as file:
+                obj = cls._from_metadata(json.load(file))
+            obj.data = DataStore.load(file_name, mmap)
+            obj._rebuild_incumbents()
+        else:
+            with open(f"{file_name}.json", encoding="UTF-8") as file:
+                obj = cls._from_metadata(json.load(file))
+            obj._df = pd.read_csv(f"{file_name}.csv", index_col=0)
+            obj._df_length = len(obj._df)
 
         if hasattr(obj, "_error") and obj._error is not None:
             import warnings
@@ -113,3 +356,16 @@ class Recorder(ABC):
                 "\033[31m" + "The data you loaded was from an optimization that had an error. See 'self._error'"
                 "for details." + "\033[0m")
         return obj
+
+    @staticmethod
+    def _load_pickle(file_name: str):
+        """ Data saved as '.csv' + '.pickle' by older versions. """
+        import pickle
+        with open(f"{file_name}.pickle", "rb") as file:
+            obj = pickle.load(file)
+
+        csv_ = pd.read_csv(f"{file_name}.csv", index_col=0)
+        obj.data = DataStore()
+        obj._df = csv_
+        obj._df_length = len(csv_)
+        return obj
@@ -0,0 +1,190 @@
+"""
+Serialize
+
+Convert problems and methods to JSON-able dictionaries (and back) for saving optimization runs.
+Functions and classes are saved as references ('module:qualified_name') and re-imported on load.
+
+"""
+import importlib
+import json
+import warnings
+from datetime import datetime
+
+import numpy as np
+
+from flex_optimization import OptimizationType
+from flex_optimization.core.variable import Variable, ContinuousVariable, DiscreteVariable
+
+
+class MissingReference:
+    """ Stands in for a function or class that could not be re-imported; raises if used. """
+
+    def __init__(self, reference: str):
+        self.reference = reference
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.reference})"
+
+    def __call__(self, *args, **kwargs):
+        raise NotImplementedError(f"'{self.reference}' could not be imported when the data was loaded.")
+
+
+def to_reference(obj) -> str | None:
+    if obj is None:
+        return None
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def from_reference(reference: str | None):
+    """ Import the object 'module:qualified_name'. Warns and returns a 'MissingReference' if it can't. """
+    if reference is None:
+        return None
+
+    module_name, qualified_name = reference.split(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for name in qualified_name.split("."):
+            obj = getattr(obj, name)
+        return obj
+    except (ImportError, AttributeError):
+        warnings.warn(f"'{reference}' could not be imported; it was replaced with a 'MissingReference'.")
+        return MissingReference(reference)
+
+
+def is_importable(obj) -> bool:
+    return obj is None or "<" not in getattr(obj, "__qualname__", "<")
+
+
+def numpy_to_json(obj):
+    """ 'default' for json.dump: numpy values become lists/numbers; anything else is not JSON-able. """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json_value(obj):
+    """ 'default' for json.dump: numpy values become lists/numbers, anything else its repr. """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return numpy_to_json(obj)
+    if isinstance(obj, type):
+        return obj.__name__
+    return repr(obj)
+
+
+def is_json(value, default: callable = None) -> bool:
+    try:
+        json.dumps(value, default=default)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def attributes_to_dict(obj, exclude: tuple = ()) -> tuple[dict, list[str]]:
+    """ JSON-able attributes of 'obj' (datetimes included), and the names of the attributes that are not. """
+    attributes = {}
+    not_saved = []
+    for key, value in vars(obj).items():
+        if key in exclude:
+            continue
+        if isinstance(value, datetime):
+            value = {"__datetime__": value.isoformat()}
+        if is_json(value):
+            attributes[key] = value
+        else:
+            not_saved.append(key)
+
+    return attributes, not_saved
+
+
+def attributes_from_dict(attributes: dict) -> dict:
+    out = {}
+    for key, value in attributes.items():
+        if isinstance(value, dict) and "__datetime__" in value:
+            value = datetime.fromisoformat(value["__datetime__"])
+        out[key] = value
+    return out
+
+
+def variable_to_dict(var: Variable) -> dict:
+    out = dict(type=type(var).__name__, name=var.name)
+    if isinstance(var, ContinuousVariable):
+        out |= dict(min_=var.min_, max_=var.max_, type_=var.type_.__name__)
+    elif isinstance(var, DiscreteVariable):
+        out |= dict(items=list(var.items))
+    return out
+
+
+def variable_from_dict(data: dict) -> Variable:
+    if data["type"] == "ContinuousVariable":
+        return ContinuousVariable(data["min_"], data["max_"], type_={"int": int}.get(data["type_"], float),
+                                  name=data["name"])
+    if data["type"] == "DiscreteVariable":
+        return DiscreteVariable(data["items"], name=data["name"])
+    raise NotImplementedError(f"Unknown variable type: {data['type']}")
+
+
+def problem_to_dict(problem) -> dict:
+    """ Problem as a JSON-able dictionary; 'kwargs' that are not JSON-able are listed in 'not_saved'. """
+    for attr in ("_func", "_metric"):
+        if not is_importable(getattr(problem, attr)):
+            warnings.warn(f"problem.{attr[1:]} ('{getattr(problem, attr).__qualname__}') is not a module-level "
+                          f"function; it is saved by name but can not be re-imported when loading.")
+
+    kwargs = {key: value for key, value in problem.kwargs.items() if is_json(value, default=numpy_to_json)}
+    not_saved = [f"kwargs.{key}" for key in problem.kwargs if key not in kwargs]
+    if not_saved:
+        warnings.warn(f"problem.kwargs {[key[7:] for key in not_saved]} are not JSON-able; they are not saved, "
+                      f"so they are missing from 'problem.kwargs' when loading.")
+
+    return dict(
+        func=to_reference(problem._func),
+        metric=to_reference(problem._metric),
+        kwargs=kwargs,
+        not_saved=not_saved,
+        variables=[variable_to_dict(var) for var in problem.variables],
+        type_=problem.type_.name,
+        pass_kwargs=problem.pass_kwargs,
+        vectorized=problem.vectorized,
+    )
+
+
+def problem_from_dict(data: dict):
+    from flex_optimization.core.problem import Problem
+    return Problem(
+        func=from_reference(data["func"]),
+        variables=[variable_from_dict(var) for var in data["variables"]],
+        kwargs=data["kwargs"],
+        metric=from_reference(data["metric"]),
+        type_=OptimizationType[data["type_"]],
+        pass_kwargs=data["pass_kwargs"],
+        vectorized=data.get("vectorized", False)
+    )
+
+
+def method_to_dict(method) -> dict:
+    """ Class, and every attribute that is JSON-able; the names of the others are listed in 'not_saved'. """
+    config, not_saved = attributes_to_dict(method, exclude=("problem", "recorder"))
+    return dict(
+        class_=to_reference(type(method)),
+        config=config,
+        stop_criterion=[repr(stop) for stop in getattr(method, "stop_criterion", [])],
+        not_saved=not_saved
+    )
+
+
+def method_from_dict(data: dict, problem, recorder):
+    """
+    Create a detached method of the saved class with the saved configuration (for inspection; it can not be
+    run as non-JSON-able state like samplers was not saved).
+    """
+    class_ = from_reference(data["class_"])
+    if isinstance(class_, MissingReference):
+        return None
+
+    method = class_.__new__(class_)
+    method.__dict__.update(attributes_from_dict(data["config"]))
+    method.problem = problem
+    method.recorder = recorder
+    return method
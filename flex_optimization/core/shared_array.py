@@ -0,0 +1,87 @@
+import itertools
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedArray:
+    """
+    NumPy array in shared memory ('multiprocessing.shared_memory').
+
+    The parent creates it (and owns the memory); workers attach to it by name with 'SharedArray.attach', without
+    copying or pickling the data. Use it as a context manager (or call 'close') to free the memory.
+    Worker processes must share the parent's resource tracker (start it with
+    'multiprocessing.resource_tracker.ensure_running()' before the workers), else theirs warns about the memory.
+
+    Parameters
+    ----------
+    shape: tuple[int, ...]
+        shape of the array
+    dtype:
+        data type of the array
+    data: np.ndarray
+        values copied into the array (once)
+
+    """
+    _generations = itertools.count()
+
+    def __init__(self, shape: tuple[int, ...], dtype=np.float64, data: np.ndarray = None):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = max(int(np.prod(self.shape)) * self.dtype.itemsize, 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self.name = self._shm.name
+        self.generation = (os.getpid(), next(self._generations))  # tells segments that reuse a name apart
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        if data is not None:
+            self.array[:] = data
+
+    def __repr__(self):
+        return f"SharedArray | name: {self.name}; shape: {self.shape}; dtype: {self.dtype}"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self) -> dict:
+        """ Only the reference is sent to workers; they attach to the memory with 'attach'. """
+        return dict(name=self.name, shape=self.shape, dtype=self.dtype.str, generation=self.generation)
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.dtype = np.dtype(self.dtype)
+
+    def close(self):
+        """ Free the memory (parent side). """
+        if getattr(self, "_shm", None) is None:
+            return
+        for key in [key for key in self._attached if key[0] == self.name]:  # attached in this process
+            self._detach(key)
+        del self.array  # release the buffer before closing
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    # worker side; most recent arrays by (name, shape, dtype, generation)
+    _attached: dict[tuple, tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+
+    def attach(self, max_attached: int = 4) -> np.ndarray:
+        """ Worker side: the array (the memory mapping is reused by later tasks). """
+        key = (self.name, self.shape, self.dtype.str, self.generation)
+        if key not in self._attached:
+            for stale in [stale for stale in self._attached if stale[0] == self.name]:  # name reused by the parent
+                self._detach(stale)
+            while len(self._attached) >= max_attached:
+                self._detach(next(iter(self._attached)))
+            shm = shared_memory.SharedMemory(name=self.name)
+            self._attached[key] = shm, np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+        return self._attached[key][1]
+
+    @classmethod
+    def _detach(cls, key: tuple):
+        shm, array = cls._attached.pop(key)
+        del array
+        shm.close()
@@ -6,3 +6,7 @@ class StopCriteria:
     def evaluate(self, method: Method, *args, **kwargs) -> bool:
         """ True = Continue; False = Stop """
         pass
+
+    def remaining(self, method: Method) -> int | None:
+        """ Evaluations left before this criterion stops 'method' (None if it can't be known in advance). """
+        return None
@@ -1,67 +1,183 @@
-import copy
 import multiprocessing
+import queue
+import time
 from functools import wraps
 
 import numpy as np
 
+from flex_optimization.core.logger_ import logger
 from flex_optimization.core.recorder import Recorder
+from flex_optimization.core.shared_array import SharedArray
+from flex_optimization.core.variable import ContinuousVariable
+
+
+def evaluate_chunk(func: callable, points: list) -> tuple[list, float]:
+    """ Worker side of a chunk: 'func(point=point)' for every point, and the time it took. """
+    start = time.perf_counter()
+    data = [func(point=point) for point in points]
+    return data, time.perf_counter() - start
 
 
 class PoolHandler:
-    def __init__(self, func: callable, pool_size: int, pool_points: list | tuple | np.ndarray,
-                 callback: callable, args: tuple = ()):
+    """
+    Evaluates points in a process pool and passes each result to 'callback' (in the calling process) as soon as it
+    is done. Workers report completions through a queue, so the calling process sleeps until a result arrives
+    and then immediately refills the free worker slot.
+
+    With 'executor' (a running Executor) evaluations go through it and 'func'/'pool_size' are not needed;
+    otherwise a new multiprocessing.Pool is created for this run.
+
+    Process pools get points in chunks (one task per chunk) to cut the inter-process overhead for cheap
+    objectives. The chunk size adapts to the measured evaluation time per point and the round-trip overhead per
+    task, so that overhead is about 'target_overhead' of the compute time; chunks are kept small enough that
+    every worker stays busy until the end. The first chunk of each worker is a single point (for timing).
+
+    If the executor supports shared memory and all variables of the problem are float 'ContinuousVariable's, the
+    (n, d) points are written once to a 'SharedArray'; tasks only carry row ranges and float results come back
+    through a shared result array, so nothing is pickled per point.
+
+    Parameters
+    ----------
+    chunk_size: int
+        fixed number of points per task (default: adaptive)
+    target_overhead: float
+        ratio of overhead to compute time the adaptive chunk size aims for
+
+    """
+    def __init__(self, func: callable = None, pool_size: int = None, pool_points: list | tuple | np.ndarray = (),
+                 callback: callable = None, args: tuple = (), executor=None, chunk_size: int = None,
+                 target_overhead: float = 0.05):
         self.func = func
-        self.pool_size = pool_size
-        if isinstance(pool_points, np.ndarray):
-            pool_points = pool_points.tolist()
-        self.pool_points = copy.deepcopy(pool_points)
+        self.executor = executor
+        self.pool_size = executor.max_workers if executor is not None else pool_size
+        self.pool_points = pool_points if isinstance(pool_points, np.ndarray) else list(pool_points)
         self.callback = callback
         self.args = args
-        self._results: list[multiprocessing.pool.AsyncResult] = []
+        self.chunk_size = chunk_size
+        self.target_overhead = target_overhead
+        self._next = 0  # index of the next point to submit
+        self._time_per_point: float | None = None  # moving averages of the measured timing
+        self._overhead_per_task: float | None = None
+        self._completed: queue.SimpleQueue = queue.SimpleQueue()  # (successful, result or exception)
         self._process_running = 0
 
     def run(self):
+        if self.executor is not None:
+            if self.executor.supports_shared_memory and self._numeric():
+                self._run_shared()
+            elif self.executor.supports_chunks:
+                self._run(self._submit_chunk(self.executor.submit_chunk))
+            else:
+                self._run(self._submit_point(self.executor.submit))
+            return
+
         with multiprocessing.Pool(self.pool_size) as pool:
-            while True:
-                # start new process
-                if self._process_running < self.pool_size and len(self.pool_points) != 0:
-                    self._start_new_process(pool)
-
-                # check for completed process
-                self._result_done_check()
-
-                # Exit statements
-                if len(self.pool_points) == 0 and len(self._results) == 0:
-                    break
-
-    def _start_new_process(self, pool):
-        point = self.pool_points.pop()
-        result = pool.apply_async(self.func, kwds=dict(point=point))
-        self._results.append(result)
-        self._process_running += 1
-
-    def _result_done_check(self):
-        for i, result in enumerate(self._results):
-            if result.ready():
-                break
-        else:
+            def submit(points, callback, error_callback):
+                pool.apply_async(evaluate_chunk, (self.func, points), callback=callback,
+                                 error_callback=error_callback)
+
+            self._run(self._submit_chunk(submit))
+
+    def _run(self, submit: callable):
+        while self._process_running < self.pool_size and self._next < len(self.pool_points):
+            submit()
+            self._process_running += 1
+
+        while self._process_running > 0:
+            self._result_done(*self._completed.get())  # blocks until a worker finishes
+            if self._next < len(self.pool_points):
+                submit()
+                self._process_running += 1
+
+    def _numeric(self) -> bool:
+        """ Points can go in a float array without changing their values or types. """
+        return len(self.pool_points) > 0 and all(
+            isinstance(var, ContinuousVariable) and var.type_ is float for var in self.executor.problem.variables
+        )
+
+    def _run_shared(self):
+        points = np.asarray(self.pool_points, dtype=np.float64)
+        with SharedArray(points.shape, data=points) as shared_points, SharedArray((len(points),)) as shared_results:
+            del points
+            self._run(self._submit_shared(shared_points, shared_results))
+
+    def _get_points(self, size: int) -> list:
+        """ The next 'size' points (as lists, if given as an array). """
+        points = self.pool_points[self._next:self._next + size]
+        self._next += len(points)
+        return points.tolist() if isinstance(points, np.ndarray) else points
+
+    def _submit_point(self, submit: callable) -> callable:
+        def submit_point():
+            point, = self._get_points(1)
+            submit(
+                point,
+                callback=lambda data: self._completed.put((True, [data])),
+                error_callback=lambda error: self._completed.put((False, error))
+            )
+
+        return submit_point
+
+    def _submit_chunk(self, submit: callable) -> callable:
+        def submit_chunk():
+            points = self._get_points(self._get_chunk_size())
+            start = time.perf_counter()
+
+            def callback(data):
+                pairs, elapsed = data
+                self._update_timing(len(pairs), elapsed, time.perf_counter() - start)
+                self._completed.put((True, pairs))
+
+            submit(points, callback=callback, error_callback=lambda error: self._completed.put((False, error)))
+
+        return submit_chunk
+
+    def _submit_shared(self, points: SharedArray, results: SharedArray) -> callable:
+        def submit_shared():
+            index = self._next
+            points_ = self._get_points(self._get_chunk_size())
+            stop = index + len(points_)
+            start = time.perf_counter()
+
+            def callback(data):
+                values, elapsed = data
+                self._update_timing(len(points_), elapsed, time.perf_counter() - start)
+                if values is None:
+                    values = results.array[index:stop].tolist()
+                self._completed.put((True, list(zip(points_, values))))
+
+            self.executor.submit_shared(points, results, index, stop, callback=callback,
+                                        error_callback=lambda error: self._completed.put((False, error)))
+
+        return submit_shared
+
+    def _get_chunk_size(self) -> int:
+        if self.chunk_size is not None:
+            return self.chunk_size
+        if self._time_per_point is None:
+            return 1
+
+        size = self._overhead_per_task / (self.target_overhead * max(self._time_per_point, 1e-9))
+        size = min(size, (len(self.pool_points) - self._next) / self.pool_size)  # keep all workers busy
+        return max(int(size), 1)
+
+    def _update_timing(self, num_points: int, elapsed: float, round_trip: float):
+        time_per_point = elapsed / max(num_points, 1)
+        overhead = max(round_trip - elapsed, 0)
+        if self._time_per_point is None:
+            self._time_per_point, self._overhead_per_task = time_per_point, overhead
             return
 
-        result = self._results.pop(i)
-        self._result_done(result)
+        alpha = 0.3
+        self._time_per_point += alpha * (time_per_point - self._time_per_point)
+        self._overhead_per_task += alpha * (overhead - self._overhead_per_task)
 
-    def _result_done(self, result):
-        self._process_error_check(result)
-        data = result.get()
-        self.callback(data)
+    def _result_done(self, successful: bool, data):
         self._process_running -= 1
-
-    @staticmethod
-    def _process_error_check(result):
-        if result.successful():
-            return  # process exited normally
-        result.get()
-        raise multiprocessing.ProcessError(f"Process exited unexpectedly with error code.")
+        if not successful:
+            raise data  # exception raised in the worker
+        for point_result in data:
+            self.callback(point_result)
 
 
 def custom_formatwarning(msg, *args, **kwargs):
@@ -69,9 +185,19 @@ def custom_formatwarning(msg, *args, **kwargs):
     return str(msg) + '\n'
 
 
+def _checkpoint_if_error(method):
+    if getattr(method, "checkpoint_file", None) is None:
+        return
+    try:
+        method.save_checkpoint(method.checkpoint_file)
+    except Exception as e:
+        logger.error(f"Checkpoint could not be saved: {e!r}")
+
+
 def save_if_error(func):
     """
     This function decorator will trigger the recorder to save the data if there is an error.
+    If checkpoints are enabled, a checkpoint is saved as well so the run can be resumed.
     """
     @wraps(func)
     def _save_if_error(*args, **kwargs):  # first arg (it is self)
@@ -80,10 +206,12 @@ def save_if_error(func):
             return func(*args, **kwargs)
 
         except KeyboardInterrupt as e:  # keyboard interrupt is not an Exception
+            _checkpoint_if_error(args[0])
             recorder._error_exit(e)
 
         except Exception as e:
             print(e)
+            _checkpoint_if_error(args[0])
             recorder._error_exit(e)
 
     return _save_if_error
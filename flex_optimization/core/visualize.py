@@ -9,9 +9,12 @@ from flex_optimization.core.recorder import Recorder
 class VizOptimization:
     def __init__(self, recorder: Recorder, true_func: callable = None):
         self.recorder = recorder
-        self.df: pd.DataFrame = self.recorder.df
         self.true_func = true_func
 
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.recorder.df
+
     def plot_by_expt(self) -> go.Figure:
         fig = go.Figure()
         for col in self.df.columns:
@@ -51,8 +54,9 @@ class VizOptimization:
 
             cols = indept_var + ["metric"]
 
+        df = self.recorder.get_df(cols)
         fig = go.Figure()
-        fig.add_trace(go.Scatter3d(x=self.df[cols[0]], y=self.df[cols[1]], z=self.df[cols[2]],
+        fig.add_trace(go.Scatter3d(x=df[cols[0]], y=df[cols[1]], z=df[cols[2]],
                                    mode="markers+lines", line=dict(width=1)
                                    ))
 
@@ -78,7 +82,7 @@ class VizOptimization:
         else:
             raise ValueError("Invalid metric_vis value.")
 
-        fig = px.scatter_3d(self.df, x=cols[0], y=cols[1], z=cols[2], color=cols[3])
+        fig = px.scatter_3d(self.recorder.get_df(cols), x=cols[0], y=cols[1], z=cols[2], color=cols[3])
         return fig
 
     def plot_5d_vis(self, indept_var: list[str] = None, metric_vis: str = "color") -> go.Figure:
@@ -100,6 +104,7 @@ class VizOptimization:
         else:
             raise ValueError("Invalid metric_vis value.")
 
-        fig = px.scatter_3d(self.df, x=cols[0], y=cols[1], z=cols[2], color=cols[3], size=cols[4])
+        fig = px.scatter_3d(self.recorder.get_df(cols), x=cols[0], y=cols[1], z=cols[2], color=cols[3],
+                            size=cols[4])
 
         return fig
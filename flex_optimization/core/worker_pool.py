@@ -0,0 +1,27 @@
+from flex_optimization.executors.process import ExecutorProcess
+
+
+class WorkerPool(ExecutorProcess):
+    """
+    Long-lived process pool for evaluating a Problem: 'ExecutorProcess' with the arguments it had as 'WorkerPool'.
+
+    Workers start once and receive the Problem once; after that only points and results are sent. Pass it as
+    'multiprocess' (or 'executor') to share it between methods. Starting it with a different Problem restarts the
+    workers. Use it as a context manager (or call 'close') to shut the workers down.
+
+    Parameters
+    ----------
+    processes: int
+        number of worker processes (default: cpu count - 1)
+    problem: Problem
+        start the workers right away for this problem
+
+    """
+    def __init__(self, processes: int = None, problem=None):
+        super().__init__(processes)
+        if problem is not None:
+            self.start(problem)
+
+    @property
+    def processes(self) -> int:
+        return self.max_workers
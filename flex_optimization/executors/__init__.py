@@ -0,0 +1,13 @@
+from flex_optimization.core.executor import EvaluationFailure, EvaluationStatus, EvaluationTimeout, RetryPolicy, \
+    WorkerCrashed
+from flex_optimization.executors.process import ExecutorProcess
+from flex_optimization.executors.thread import ExecutorThread
+from flex_optimization.executors.inline import ExecutorInline
+from flex_optimization.executors.asyncio_ import ExecutorAsyncio
+
+executors = {
+    "process": ExecutorProcess,
+    "thread": ExecutorThread,
+    "inline": ExecutorInline,
+    "asyncio": ExecutorAsyncio
+}
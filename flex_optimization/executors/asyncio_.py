@@ -0,0 +1,97 @@
+import asyncio
+import concurrent.futures
+import threading
+from concurrent.futures import Future
+
+from flex_optimization.core.executor import Executor
+
+
+class ExecutorAsyncio(Executor):
+    """
+    Executor: Asyncio
+
+    Runs an asyncio event loop in a background thread. Coroutine functions ('async def') are awaited on the
+    loop; plain functions are run in the loop's default thread pool. A semaphore keeps at most 'max_workers'
+    evaluations in flight. Suited for I/O-bound objectives (remote simulations, instruments, web services).
+    This is the default executor of passive methods and samplers when 'problem.func' is a coroutine function.
+
+    Parameters
+    ----------
+    max_workers: int
+        number of evaluations in flight at the same time (default: 10)
+
+    """
+    def __init__(self, max_workers: int = None):
+        super().__init__(max_workers)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._pending: set[Future] = set()  # submitted evaluations that haven't finished
+
+    @staticmethod
+    def _default_max_workers() -> int:
+        return 10
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_loop"] = None
+        state["_thread"] = None
+        state["_semaphore"] = None
+        state["_pending"] = set()
+        return state
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def _start(self):
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+        self._thread = threading.Thread(target=self._loop.run_forever, name="flex_optimization-asyncio", daemon=True)
+        self._thread.start()
+
+    async def _evaluate(self, point):
+        async with self._semaphore:
+            if self.problem.is_async:
+                return await self.problem.evaluate_async(point)
+            return await self._loop.run_in_executor(None, self.problem.evaluate, point)
+
+    def submit(self, point, callback: callable, error_callback: callable):
+        def done(future: Future):
+            self._pending.discard(future)
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                error_callback(future.exception())
+            else:
+                callback((point, future.result()))
+
+        future = asyncio.run_coroutine_threadsafe(self._evaluate(point), self._loop)
+        self._pending.add(future)
+        future.add_done_callback(done)
+
+    def close(self):
+        """ Wait for the evaluations in flight, then stop the loop. """
+        if self._loop is None:
+            return
+        concurrent.futures.wait(list(self._pending))
+        self._stop()
+
+    def terminate(self):
+        """ Cancel the evaluations in flight (their callbacks aren't called) and stop the loop. """
+        if self._loop is None:
+            return
+        pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        concurrent.futures.wait(pending)
+        self._stop()
+
+    def _stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
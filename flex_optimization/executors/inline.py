@@ -0,0 +1,35 @@
+from flex_optimization.core.executor import Executor
+
+
+class ExecutorInline(Executor):
+    """
+    Executor: Inline
+
+    Evaluates each point immediately in the calling thread (no parallelism). Useful for debugging the parallel
+    code path and for objectives that are not safe to run concurrently.
+
+    """
+    def __init__(self, max_workers: int = 1):
+        super().__init__(max_workers)
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def _start(self):
+        self._running = True
+
+    def submit(self, point, callback: callable, error_callback: callable):
+        try:
+            result = self.problem.evaluate(point)
+        except Exception as e:
+            error_callback(e)
+            return
+        callback((point, result))
+
+    def map(self, points: list) -> list:
+        return [self.problem.evaluate(point) for point in points]
+
+    def close(self):
+        self._running = False
@@ -0,0 +1,384 @@
+import collections
+import heapq
+import itertools
+import multiprocessing
+import threading
+import time
+from multiprocessing import connection as mp_connection
+from multiprocessing import resource_tracker
+
+import numpy as np
+
+from flex_optimization.core.executor import Executor, EvaluationFailure, EvaluationStatus, EvaluationTimeout, \
+    RetryPolicy, WorkerCrashed
+from flex_optimization.core.logger_ import logger
+from flex_optimization.core.shared_array import SharedArray
+
+_problem = None  # Problem of this worker process; set once by '_worker'
+
+
+def _worker(problem, connection: mp_connection.Connection):
+    """ Worker process: runs the tasks '(task_id, func, args)' received on 'connection' until None is received. """
+    global _problem
+    _problem = problem
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+
+        task_id, func, args = task
+        try:
+            reply = task_id, True, func(*args)
+        except Exception as e:
+            reply = task_id, False, e
+        try:
+            connection.send(reply)
+        except Exception as e:  # result or exception can't be pickled
+            connection.send((task_id, False, RuntimeError(f"Reply could not be sent to the parent: {e!r}")))
+
+
+def _evaluate(point) -> tuple:
+    return point, _problem.evaluate(point)
+
+
+def _evaluate_chunk(points: list) -> tuple[list, float]:
+    start = time.perf_counter()
+    pairs = [_evaluate(point) for point in points]
+    return pairs, time.perf_counter() - start
+
+
+def _evaluate_shared(points: SharedArray, results: SharedArray, start: int, stop: int) -> tuple[list | None, float]:
+    """ Rows 'start:stop' of the shared points; float results are written to the shared results (returns None). """
+    time_start = time.perf_counter()
+    points_ = points.attach()[start:stop]
+    if _problem.vectorized:
+        values = _problem.evaluate_batch(points_)
+    else:
+        values = [_problem.evaluate(point) for point in points_.tolist()]
+
+    if isinstance(values, np.ndarray):
+        values = values if values.ndim == 1 and values.dtype.kind == "f" else values.tolist()
+    if isinstance(values, np.ndarray) or all(isinstance(value, float) for value in values):
+        results.attach()[start:stop] = values
+        values = None
+    return values, time.perf_counter() - time_start
+
+
+class _Task:
+    def __init__(self, task_id: int, func: callable, args: tuple, callback: callable, error_callback: callable,
+                 point=None):
+        self.task_id = task_id
+        self.func = func
+        self.args = args
+        self.callback = callback
+        self.error_callback = error_callback
+        self.point = point  # single point tasks (failures are handled per point)
+        self.attempts = 0
+        self.timeouts = 0  # counted apart from 'attempts', which the retry policy uses
+
+
+class _Worker:
+    def __init__(self, problem):
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker, args=(problem, child), daemon=True,
+                                               name="flex_optimization-worker")
+        self.process.start()
+        child.close()
+        self.task: _Task | None = None
+        self.deadline: float | None = None
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class ExecutorProcess(Executor):
+    """
+    Executor: Process
+
+    Long-lived worker processes. Workers start once and receive the Problem once; after that only points and
+    results are sent. Best for CPU-bound objectives that hold the GIL. 'problem.func' (and the results) must be
+    picklable.
+
+    For problems with only float variables, 'PoolHandler' puts the points (and float results) in shared memory,
+    so nothing is pickled per point; vectorized problems are evaluated a chunk at a time in the workers.
+
+    Fault tolerance (points are sent one per task when any of these is set):
+    * 'timeout': an evaluation running longer is stopped (its worker is killed and replaced) and handled by
+      'on_timeout'
+        * "nan": recorded as failed with NaN
+        * "penalty": recorded as failed with 'penalty'
+        * "requeue": evaluated once more (at the end of the queue); "nan" if it times out again
+    * 'retry': evaluations that raise, or whose worker dies (e.g. a segfault in native code), are tried again
+    * 'on_failure': what happens once a point has no attempts left
+        * "raise": the error is raised (stops the run)
+        * "nan" / "penalty": recorded as failed with NaN / 'penalty'
+
+    Dead workers are always replaced. Failed points are passed on as 'EvaluationFailure' (methods record them
+    with their 'EvaluationStatus'; see 'Recorder.evaluation_status'). 'timeouts', 'failures' and 'respawns' count
+    what happened.
+
+    Parameters
+    ----------
+    max_workers: int
+        number of worker processes (default: cpu count - 1)
+    timeout: float
+        wall-clock limit (s) per evaluation
+    on_timeout: str
+        "nan", "penalty" or "requeue"
+    penalty:
+        recorded value of failed evaluations for "penalty"
+    retry: RetryPolicy
+        attempts and backoff for evaluations that raise or crash (default: no retry)
+    on_failure: str
+        "raise", "nan" or "penalty"
+
+    """
+    timeout_policies = ("nan", "penalty", "requeue")
+    failure_policies = ("raise", "nan", "penalty")
+
+    def __init__(self, max_workers: int = None, timeout: float = None, on_timeout: str = "nan", penalty=None,
+                 retry: RetryPolicy = None, on_failure: str = "raise"):
+        super().__init__(max_workers)
+        if on_timeout not in self.timeout_policies:
+            raise ValueError(f"Invalid 'on_timeout': {on_timeout} (options: {self.timeout_policies})")
+        if on_failure not in self.failure_policies:
+            raise ValueError(f"Invalid 'on_failure': {on_failure} (options: {self.failure_policies})")
+        if "penalty" in (on_timeout, on_failure) and penalty is None:
+            raise ValueError("The 'penalty' policy needs a 'penalty'.")
+        self.timeout = timeout
+        self.on_timeout = on_timeout
+        self.penalty = penalty
+        self.retry = retry
+        self.on_failure = on_failure
+        self.timeouts = 0
+        self.failures = 0
+        self.respawns = 0
+        self._workers: list[_Worker] = []
+        self._tasks: collections.deque[_Task] = collections.deque()  # waiting for a worker
+        self._delayed: list[tuple[float, int, _Task]] = []  # heap of retries waiting for their backoff
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup_r = self._wakeup_w = None  # wakes the manager thread up when tasks are added
+        self._thread: threading.Thread | None = None
+        self._closing = False
+
+    def __del__(self):
+        if getattr(self, "_workers", None):
+            for worker in self._workers:
+                worker.process.kill()
+
+    def __getstate__(self) -> dict:
+        """ Processes can't be pickled (e.g. in checkpoints); they are started again on next use. """
+        state = self.__dict__.copy()
+        state.update(_workers=[], _tasks=collections.deque(), _delayed=[], _task_ids=None, _lock=None,
+                     _wakeup_r=None, _wakeup_w=None, _thread=None, _closing=False)
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def fault_tolerant(self) -> bool:
+        """ Failures are handled per point. """
+        return self.timeout is not None or self.retry is not None or self.on_failure != "raise"
+
+    @property
+    def supports_chunks(self) -> bool:
+        return not self.fault_tolerant
+
+    @property
+    def supports_shared_memory(self) -> bool:
+        return not self.fault_tolerant
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def _start(self):
+        resource_tracker.ensure_running()  # shared by the workers, for 'SharedArray'
+        self._closing = False
+        self._workers = [_Worker(self.problem) for _ in range(self.max_workers)]
+        self._wakeup_r, self._wakeup_w = multiprocessing.Pipe(duplex=False)
+        self._thread = threading.Thread(target=self._manage, name="flex_optimization-process", daemon=True)
+        self._thread.start()
+
+    def _put(self, func: callable, args: tuple, callback: callable, error_callback: callable, point=None):
+        with self._lock:
+            self._tasks.append(_Task(next(self._task_ids), func, args, callback, error_callback, point))
+        self._wakeup_w.send_bytes(b"")
+
+    def submit(self, point, callback: callable, error_callback: callable):
+        self._put(_evaluate, (point,), callback, error_callback, point=point)
+
+    def submit_chunk(self, points: list, callback: callable, error_callback: callable):
+        self._put(_evaluate_chunk, (points,), callback, error_callback)
+
+    def submit_shared(self, points: SharedArray, results: SharedArray, start: int, stop: int, callback: callable,
+                      error_callback: callable):
+        self._put(_evaluate_shared, (points, results, start, stop), callback, error_callback)
+
+    def _manage(self):
+        """
+        Manager thread: hands out tasks, passes on results, replaces workers that timed out or died and
+        re-queues retries once their backoff is over.
+        """
+        while True:
+            with self._lock:
+                while self._delayed and self._delayed[0][0] <= time.monotonic():
+                    self._tasks.append(heapq.heappop(self._delayed)[2])
+                unsent = self._dispatch()
+                if self._closing and not self._tasks and not self._delayed and \
+                        all(worker.task is None for worker in self._workers):
+                    return
+                deadlines = [worker.deadline for worker in self._workers if worker.deadline is not None]
+                deadlines += [self._delayed[0][0]] if self._delayed else []
+
+            for worker, task in unsent:
+                self._lost(worker, task)
+            if unsent:
+                continue  # the tasks may have been re-queued
+
+            wait_time = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+            busy = [worker for worker in self._workers if worker.task is not None]
+            waitables = [self._wakeup_r] + [worker.connection for worker in busy] \
+                + [worker.process.sentinel for worker in busy]
+            ready = mp_connection.wait(waitables, wait_time)
+
+            if self._wakeup_r in ready:
+                while self._wakeup_r.poll():
+                    self._wakeup_r.recv_bytes()
+
+            for worker in busy:
+                if worker.connection in ready or worker.process.sentinel in ready:
+                    self._receive(worker)
+                elif worker.deadline is not None and time.monotonic() >= worker.deadline:
+                    self._timed_out(worker)
+
+    def _dispatch(self) -> list[tuple[_Worker, _Task]]:
+        """ Hand out tasks to idle workers; returns the workers (and tasks) whose 'send' failed. """
+        unsent = []
+        for worker in list(self._workers):
+            if not self._tasks:
+                break
+            if worker.task is None:
+                if not worker.process.is_alive():  # idle worker died; replaced once it is needed
+                    worker = self._replace(worker)
+                task = self._tasks.popleft()
+                task.attempts += 1
+                worker.task = task
+                worker.deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+                try:
+                    worker.connection.send((task.task_id, task.func, task.args))
+                except OSError:  # worker died since the check (e.g. BrokenPipeError)
+                    unsent.append((worker, task))
+        return unsent
+
+    def _lost(self, worker: _Worker, task: _Task):
+        """ 'worker' died with 'task'; it is replaced and the task goes through the retry policy. """
+        self._replace(worker)
+        self._failed(task, EvaluationStatus.CRASHED, WorkerCrashed(
+            f"Worker process died (exit code: {worker.process.exitcode})."))
+
+    def _receive(self, worker: _Worker):
+        task = worker.task
+        try:
+            _, successful, data = worker.connection.recv()
+        except (EOFError, OSError):  # worker died
+            self._lost(worker, task)
+            return
+        except Exception as e:  # the result can't be unpickled here
+            successful, data = False, e
+
+        worker.task = worker.deadline = None
+        if successful:
+            task.callback(data)
+        else:
+            self._failed(task, EvaluationStatus.ERROR, data)
+
+    def _failed(self, task: _Task, status: EvaluationStatus, error: Exception):
+        """ Retry the task, raise the error or pass the point on as failed. """
+        if task.point is None:  # chunk
+            task.error_callback(error)
+            return
+
+        if self.retry is not None and self.retry.should_retry(task.attempts, error):
+            with self._lock:
+                heapq.heappush(self._delayed, (time.monotonic() + self.retry.delay(task.attempts), task.task_id, task))
+            return
+
+        if self.on_failure == "raise":
+            task.error_callback(error)
+            return
+
+        self.failures += 1
+        logger.warning(f"Evaluation of {task.point} failed after {task.attempts} attempt(s): {error!r}")
+        value = self.penalty if self.on_failure == "penalty" else np.nan
+        task.callback((task.point, EvaluationFailure(status, error, value, task.attempts)))
+
+    def _timed_out(self, worker: _Worker):
+        task = worker.task
+        self.timeouts += 1
+        self._replace(worker)
+        error = EvaluationTimeout(f"Evaluation timed out after {self.timeout} s.")
+
+        if task.point is None:  # chunk
+            task.error_callback(error)
+            return
+
+        task.timeouts += 1
+        logger.warning(f"Evaluation of {task.point} timed out after {self.timeout} s (on_timeout: {self.on_timeout}).")
+        if self.on_timeout == "requeue" and task.timeouts < 2:
+            with self._lock:
+                self._tasks.append(task)
+            return
+        value = self.penalty if self.on_timeout == "penalty" else np.nan
+        task.callback((task.point, EvaluationFailure(EvaluationStatus.TIMEOUT, error, value, task.attempts)))
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        """ Kill 'worker' and start a new one in its place. """
+        worker.kill()
+        self.respawns += 1
+        new_worker = _Worker(self.problem)
+        self._workers[self._workers.index(worker)] = new_worker
+        return new_worker
+
+    def close(self):
+        if self._thread is None:
+            return
+        with self._lock:
+            self._closing = True
+        self._wakeup_w.send_bytes(b"")
+        self._thread.join()
+        for worker in self._workers:
+            try:
+                worker.connection.send(None)
+            except OSError:  # already dead
+                pass
+            worker.process.join()
+            worker.connection.close()
+        self._cleanup()
+
+    def terminate(self):
+        if self._thread is None:
+            return
+        with self._lock:
+            self._closing = True
+            self._tasks.clear()
+            self._delayed.clear()
+            for worker in self._workers:
+                worker.kill()
+                worker.task = worker.deadline = None
+        self._wakeup_w.send_bytes(b"")
+        self._thread.join()
+        self._cleanup()
+
+    def _cleanup(self):
+        self._workers = []
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+        self._wakeup_r = self._wakeup_w = None
+        self._thread = None
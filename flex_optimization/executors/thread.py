@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from flex_optimization.core.executor import Executor
+
+
+class ExecutorThread(Executor):
+    """
+    Executor: Thread
+
+    Thread pool in the calling process. Nothing is pickled, so it suits objectives that release the GIL
+    (NumPy/SciPy) or wait on I/O (instruments, simulators, remote jobs). 'problem.func' must be thread-safe.
+
+    Parameters
+    ----------
+    max_workers: int
+        number of threads (default: cpu count - 1)
+
+    """
+    def __init__(self, max_workers: int = None):
+        super().__init__(max_workers)
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
+
+    def _start(self):
+        self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="flex_optimization")
+
+    def submit(self, point, callback: callable, error_callback: callable):
+        def done(future: Future):
+            if future.exception() is not None:
+                error_callback(future.exception())
+            else:
+                callback((point, future.result()))
+
+        self._pool.submit(self.problem.evaluate, point).add_done_callback(done)
+
+    def map(self, points: list) -> list:
+        return list(self._pool.map(self.problem.evaluate, points))
+
+    def close(self):
+        if self._pool is None:
+            return
+        self._pool.shutdown(wait=True)
+        self._pool = None
+
+    def terminate(self):
+        if self._pool is None:
+            return
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
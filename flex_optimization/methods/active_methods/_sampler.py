@@ -1,23 +1,31 @@
 from abc import ABC, abstractmethod
 
 from flex_optimization.core.data_point import DataPoint
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.problem import Problem
 from flex_optimization.core.method_subclass import ActiveMethod, StopCriteria
 
 
 class MethodSampler(ActiveMethod, ABC):
+    batch_size: int = 10_000  # max. points per call of 'problem.evaluate_batch'
 
     def __init__(self,
                  problem: Problem,
                  stop_criterion: StopCriteria | list[StopCriteria] | list[list[StopCriteria]],
                  seed: int = None,
                  multiprocess: bool | int = False,
-                 recorder: Recorder = None):
+                 recorder: Recorder = None,
+                 executor: Executor | str = None):
 
         self.seed = seed
         self.sampler = None
-        super().__init__(problem, stop_criterion, multiprocess, recorder)
+        super().__init__(problem, stop_criterion, multiprocess, recorder, executor=executor)
+
+    @property
+    def parallel(self) -> bool:
+        """ Coroutine functions are evaluated concurrently (with 'ExecutorAsyncio' unless an executor is set). """
+        return super().parallel or self.problem.is_async
 
     @abstractmethod
     def method_init(self):
@@ -34,21 +42,68 @@ class MethodSampler(ActiveMethod, ABC):
         """ Get multiple points. """
         return [self.get_point() for _ in range(num)]
 
+    def _batch_run_step(self, step: int):
+        """
+        Points don't depend on earlier results, so they are evaluated in batches. Batches are no larger than the
+        evaluations the stop criteria have left; with criteria that have no known budget (e.g. convergence) they
+        start small and double. Every evaluated point is recorded, even past a stop criterion met mid-batch.
+        """
+        open_size = 16  # batch size while a stop criterion has no known budget
+        while step > 0:
+            budget, bounded = self._remaining_budget()
+            num = min(step, self.batch_size, max(budget, 1) if budget is not None else self.batch_size)
+            if not bounded:
+                num = min(num, open_size)
+                open_size *= 2
+            step -= num
+            points = self.get_points(num)
+            results = self.problem.evaluate_batch(points)
+            metrics = self.problem.metric_batch(results)
+            start = self.iteration_count
+            stop = False
+            for point, result, metric in zip(points, results, metrics):
+                self.iteration_count += 1
+                self._tell(DataPoint(point, result, metric, self.iteration_count))
+                stop = stop or not self._check_stop_criterion()
+            if stop:
+                return
+
+            # the sampler is past the whole batch, so checkpoints are only taken between batches
+            if self.checkpoint_file is not None and \
+                    self.iteration_count // self.checkpoint_every > start // self.checkpoint_every:
+                self.save_checkpoint(self.checkpoint_file)
+
+    def _remaining_budget(self) -> tuple[int | None, bool]:
+        """
+        Evaluations left before a stop criterion is met (None: no criterion knows), and whether every criterion
+        knows its budget.
+        """
+        def remaining(criteria) -> int | None:
+            if isinstance(criteria, list):  # 'and' criteria: all of them have to be met
+                values = [remaining(criteria_) for criteria_ in criteria]
+                return None if None in values else max(values)
+            return criteria.remaining(self)
+
+        values = [remaining(criteria) for criteria in self.stop_criterion]
+        known = [value for value in values if value is not None]
+        return (min(known) if known else None), len(known) == len(values)
+
     def _multi_run_step(self, step: int):
-        points = self.get_points(min(step, self._get_steps()))
+        step = min(step, max(self._get_steps() - self.recorder.num_data_points, 0))
 
         def callback(results):
             point_, result = results
-            metric = self.problem.metric(result)
-            self.recorder.record(self.recorder.EVALUATION, data_point=DataPoint(point_, result, metric))
+            self.iteration_count += 1
+            self._tell(self._to_data_point(point_, result, self.iteration_count))
 
-        from functools import partial
         from flex_optimization.core.utils import PoolHandler
-        from flex_optimization.core.method_subclass import temp_func
-        pool = PoolHandler(
-            func=partial(temp_func, func=self.problem.evaluate),
-            pool_size=self._get_pool_size(),
-            pool_points=points,
-            callback=callback
-        )
-        pool.run()
+        while step > 0:
+            # with checkpoints, points are drawn a checkpoint interval at a time and all of them are recorded
+            # before the checkpoint, so the saved sampler is never ahead of the saved evaluations
+            num = step
+            if self.checkpoint_file is not None:
+                num = min(step, self.checkpoint_every - self.iteration_count % self.checkpoint_every)
+            step -= num
+            pool = PoolHandler(executor=self._get_executor(), pool_points=self.get_points(num), callback=callback)
+            pool.run()
+            self._checkpoint_step()
@@ -1,9 +1,12 @@
 
+import itertools
+import queue
 from argparse import Namespace
 
 from flex_optimization import OptimizationType
 from flex_optimization.core.data_point import DataPoint
 from flex_optimization.methods import MethodType, MethodClassification
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.variable import ContinuousVariable, DiscreteVariable
 from flex_optimization.core.problem import Problem
@@ -20,6 +23,12 @@ def _check_for_package():
                           "For more information see: https://dragonfly-opt.readthedocs.io/en/master/install/\n")
 
 
+def _supports_asynchronous(optimizer) -> bool:
+    """ Asynchronous mode sets the points in flight on DragonFly's model directly (not part of its public API). """
+    return all(hasattr(optimizer, attr) for attr in ("eval_points_in_progress", "_build_new_model", "_set_next_gp")) \
+        and hasattr(optimizer.func_caller, "get_processed_domain_point_from_raw")
+
+
 def dragonfly_setup(options, config):
     # Customizable algorithm settings
     dragon_options = Namespace(
@@ -43,7 +52,16 @@ def dragonfly_setup(options, config):
 
 
 class MethodBODragon(ActiveMethod):
-    """ Setup for single objective only"""
+    """
+    Setup for single objective only
+
+    Asynchronous mode ('asynchronous=True'; needs 'multiprocess' or 'executor'): a new point is asked for as soon as an
+    evaluation finishes, with the model updated with all completed evaluations. Points still being evaluated are
+    passed to DragonFly ('eval_points_in_progress'), whose acquisitions hallucinate them (posterior mean as
+    the observation), so the new point moves away from them. Workers stay busy even when evaluation times vary.
+    Once a stop criterion is met no new points are issued; points still in flight are waited for and recorded.
+
+    """
 
     def __init__(self,
                  problem: Problem,
@@ -51,8 +69,11 @@ class MethodBODragon(ActiveMethod):
                  init_expts: int = 5,
                  options: dict = None,
                  multiprocess: bool | int = False,
-                 recorder: Recorder = None):
+                 recorder: Recorder = None,
+                 executor: Executor | str = None,
+                 asynchronous: bool = False):
         _check_for_package()
+        self.asynchronous = asynchronous
 
         default_options = dict(
             build_new_model_every=1,
@@ -64,9 +85,13 @@ class MethodBODragon(ActiveMethod):
             default_options = default_options | options  # overwrite defaults
         self.options = default_options
 
-        super().__init__(problem, stop_criterion, multiprocess, recorder)
+        super().__init__(problem, stop_criterion, multiprocess, recorder, executor=executor)
+        if self.asynchronous and not self.parallel:
+            raise ValueError("'asynchronous' needs a parallel run (set 'multiprocess' or 'executor').")
 
         self.optimizer = dragonfly_setup(self.options, self._get_config())
+        if self.asynchronous and not _supports_asynchronous(self.optimizer):
+            raise NotImplementedError("Asynchronous mode is not supported by the installed DragonFly version.")
         self._init_points = self.optimizer.ask(init_expts)
 
     def _get_config(self):
@@ -96,7 +121,7 @@ class MethodBODragon(ActiveMethod):
 
     def get_point(self) -> list:
         if not self._flag_init:  # Initialization phase
-            point = self._init_points.pop()
+            point = self._init_points.pop(0)
             if not self._init_points:  # no more initialization points
                 self._flag_init = True
             return point
@@ -108,6 +133,8 @@ class MethodBODragon(ActiveMethod):
 
     def _tell(self, datapoint: DataPoint):
         super()._tell(datapoint)
+        if datapoint.status:
+            return  # failed evaluation; not given to the model
 
         # DragonFly is a maximizer, so this enables minimization
         if self.problem.type_ == OptimizationType.MIN:
@@ -119,6 +146,10 @@ class MethodBODragon(ActiveMethod):
         self.optimizer.tell([(datapoint.point, metric)])  # return result to algorithm
 
     def _multi_run_step(self, algo_steps: int):
+        if self.asynchronous:
+            self._async_run_step(algo_steps)
+            return
+
         self._multi_run_step_init()  # Initialization phase
         if not self._check_stop_criterion():
             return
@@ -134,25 +165,88 @@ class MethodBODragon(ActiveMethod):
             self.optimizer._build_new_model()  # key line! update model using prior results
             self.optimizer._set_next_gp()  # key line! set next GP
             points = [self.optimizer.ask() for _ in range(num_points)]
-            result = self.problem.evaluate_multiprocessing(points, self._get_pool_size())
-            metric = self.problem.metric(result)
-            for i in range(num_points):
-                self._tell(DataPoint(points[i], result[i], metric[i], self.iteration_count))
+            results = self._get_executor().map(points)
+            for point, result in zip(points, results):
+                self._tell(self._to_data_point(point, result, self.iteration_count))
             if not self._check_stop_criterion():
                 break
 
             self.recorder.record(self.recorder.NOTES, text=f"/ Step | {self.iteration_count}/{algo_steps} complete.")
 
+    def _async_run_step(self, algo_steps: int):
+        executor = self._get_executor()
+        init_points = self._init_points
+        self._init_points = []
+        self._flag_init = True
+        self.recorder.record(self.recorder.NOTES,
+                             text=f"Asynchronous | {executor.max_workers} points in flight; initialization points: "
+                                  f"{len(init_points)}")
+
+        completed = queue.SimpleQueue()  # (key, successful, result or exception)
+        pending = {}  # key: point being evaluated
+        keys = itertools.count()
+
+        def submit():
+            point = init_points.pop(0) if init_points else self._ask_with_points_in_flight(list(pending.values()))
+            key = next(keys)
+            pending[key] = point
+            executor.submit(
+                point,
+                callback=lambda data, key_=key: completed.put((key_, True, data[1])),
+                error_callback=lambda error, key_=key: completed.put((key_, False, error))
+            )
+
+        issued = 0
+        while len(pending) < executor.max_workers and issued < algo_steps:
+            submit()
+            issued += 1
+
+        error = None
+        running = True  # False once stopped; points still in flight are waited for before returning
+        while pending:
+            key, successful, result = completed.get()  # blocks until a worker finishes
+            point = pending.pop(key)
+            if not successful:
+                error = error or result
+                running = False
+                continue
+
+            self.iteration_count += 1
+            self._tell(self._to_data_point(point, result, self.iteration_count))
+            if running and not self._check_stop_criterion():
+                running = False
+            if not running:
+                continue
+            self._checkpoint_step()
+
+            if issued < algo_steps:
+                submit()
+                issued += 1
+
+        if error is not None:
+            raise error
+
+    def _ask_with_points_in_flight(self, points: list) -> list:
+        """ Asks DragonFly for a new point; 'points' (still being evaluated) are hallucinated by the acquisition. """
+        # ask-tell mode keeps no points in progress of its own, so they are set for this ask only
+        self.optimizer.eval_points_in_progress = \
+            [self.optimizer.func_caller.get_processed_domain_point_from_raw(point) for point in points]
+        try:
+            self.optimizer._build_new_model()  # update model with the completed evaluations
+            self.optimizer._set_next_gp()
+            return self.optimizer.ask()
+        finally:
+            self.optimizer.eval_points_in_progress = []
+
     def _multi_run_step_init(self):
         points = self._init_points
         self.recorder.record(self.recorder.NOTES,
                              text=f"Multiprocessing | Initialization ran (points being evaluated: "
                                   f"{len(self._init_points)})")
         self._flag_init = True
-        result = self.problem.evaluate_multiprocessing(points, self._get_pool_size())
-        metric = self.problem.metric(result)
-        for i in range(len(points)):
-            self._tell(DataPoint(points[i], result[i], metric[i], 0))
+        results = self._get_executor().map(points)
+        for point, result in zip(points, results):
+            self._tell(self._to_data_point(point, result, 0))
 
 
 method_class = MethodClassification(
@@ -0,0 +1,97 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flex_optimization.core.executor import Executor
+from flex_optimization.core.method_subclass import ActiveMethod
+
+
+class StopSearch(Exception):
+    """ Raised in a local search of a group when the stop criteria are met. """
+
+
+def run_local_searches(method: ActiveMethod, searches: list[callable], executor: Executor,
+                       tags: list[int] = None) -> tuple[list, bool]:
+    """
+    Run local searches side by side (up to 'executor.max_workers' at a time).
+
+    Each search runs in a thread of this process (SciPy's own work is cheap) as 'search(evaluate, callback)':
+    'evaluate(points)' returns the metrics of the points (evaluated by 'executor') and 'callback' counts an
+    iteration. Evaluations are passed back through a queue, so they are recorded (with 'method._tell') and
+    the stop criteria are checked in the calling thread. Once the stop criteria are met, every search ends at its
+    next evaluation.
+
+    Parameters
+    ----------
+    method: ActiveMethod
+        method recording the evaluations
+    searches: list[callable]
+        local searches
+    executor: Executor
+        running executor
+    tags: list[int]
+        the index of the search of each recorded evaluation is appended
+
+    Returns
+    -------
+    results: list
+        result of each search (None if stopped)
+    stopped: bool
+        the stop criteria were met
+
+    """
+    events = queue.SimpleQueue()  # (kind, search index, data)
+    stop = threading.Event()
+
+    def run(index: int, search: callable):
+        def evaluate(points: list) -> list:
+            if stop.is_set():
+                raise StopSearch
+            metrics = []
+            for point, result in zip(points, executor.map(points)):
+                data_point = method._to_data_point(point, result)
+                events.put(("evaluation", index, data_point))
+                metrics.append(data_point.metric[0])
+            return metrics
+
+        def callback(*args, **kwargs):
+            events.put(("iteration", index, None))
+
+        try:
+            events.put(("done", index, search(evaluate, callback)))
+        except StopSearch:
+            events.put(("done", index, None))
+        except Exception as e:
+            events.put(("error", index, e))
+
+    results = [None] * len(searches)
+    error = None
+    with ThreadPoolExecutor(max(min(executor.max_workers, len(searches)), 1),
+                            thread_name_prefix="flex_optimization-search") as threads:
+        for index, search in enumerate(searches):
+            threads.submit(run, index, search)
+
+        for _ in range(len(searches)):
+            kind, index, data = events.get()
+            while kind not in ("done", "error"):
+                if kind == "iteration":
+                    method.iteration_count += 1
+                elif not stop.is_set():
+                    data.iteration = method.iteration_count
+                    data.start = index
+                    if tags is not None:
+                        tags.append(index)
+                    method._tell(data)
+                    if not method._check_stop_criterion():
+                        stop.set()
+                kind, index, data = events.get()
+
+            if kind == "error":
+                error = error or data
+                stop.set()
+            else:
+                results[index] = data
+
+    if error is not None:
+        raise error
+    return results, stop.is_set()
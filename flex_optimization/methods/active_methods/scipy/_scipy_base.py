@@ -1,14 +1,19 @@
 from abc import ABC
+from functools import partial
 
 import numpy as np
 from scipy.optimize import minimize
+from scipy.stats import qmc
 
 from flex_optimization import OptimizationType, NotSupported
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.utils import save_if_error
 from flex_optimization.core.variable import DiscreteVariable
 from flex_optimization.core.problem import Problem
 from flex_optimization.core.method_subclass import ActiveMethod, StopCriteria
+from flex_optimization.executors import ExecutorInline
+from flex_optimization.methods.active_methods.scipy._parallel import run_local_searches
 from flex_optimization.stop_criteria import StopIterationEvaluation, StopAbsoluteChange
 
 
@@ -16,6 +21,26 @@ class SciPyBase(ActiveMethod, ABC):
     """
     https://docs.scipy.org/doc/scipy/tutorial/optimize.html?highlight=bfgs#optimization-scipy-optimize
 
+    When run in parallel ('multiprocess' or 'executor'), a "2-point" 'jac' is replaced by a forward difference
+    gradient that evaluates all stencil points at once with the executor (every evaluation is recorded).
+
+    Multi-start: with 'starts', independent local searches are run, concurrently when run in parallel (up to
+    'max_workers' searches at a time, with their evaluations done by the executor; see 'run_local_searches').
+    All evaluations go to the one recorder (its 'start' column, also in 'start_of_evaluation', gives the start of
+    each recorded evaluation) and the stop criteria apply to the whole group. 'start_results' has the SciPy result of each search (None if
+    stopped).
+
+    Parameters
+    ----------
+    starts: int | list | np.ndarray
+        * None: one search from 'x0'
+        * int: number of starts; 'x0' and the rest drawn from 'start_design'
+        * (k, d) array: the starting points ('x0' is not used)
+    start_design: str
+        "sobol" or "lhs"
+    seed: int
+        seed of 'start_design'
+
     """
 
     def __init__(self,
@@ -25,13 +50,23 @@ class SciPyBase(ActiveMethod, ABC):
                  multiprocess: bool | int = False,
                  recorder: Recorder = None,
                  options: dict = None,
-                 _method: str = None):
+                 _method: str = None,
+                 executor: Executor | str = None,
+                 starts: int | list | np.ndarray = None,
+                 start_design: str = "sobol",
+                 seed: int = None):
 
         self.x0 = x0
         self.options = options if options is not None else {}
         self._method = _method
+        self.starts = starts
+        self.start_design = start_design
+        self.seed = seed
+        self.start_points: np.ndarray | None = None
+        self.start_of_evaluation: list[int] = []
+        self.start_results: list = []
 
-        super().__init__(problem, stop_criterion, multiprocess, recorder)
+        super().__init__(problem, stop_criterion, multiprocess, recorder, executor=executor)
 
     def method_init(self):
         self._flag_init = True
@@ -63,17 +98,106 @@ class SciPyBase(ActiveMethod, ABC):
         if not self._flag_init:
             self.method_init()
 
-        if self.problem.type_ == OptimizationType.MAX:
-            def maximize_func(*args, **kwargs):
-                return -1 * self.problem.evaluate_capture(*args, **kwargs)
-
-            func = maximize_func
-        else:
-            func = self.problem.evaluate_capture
+        if self.starts is not None:
+            self._run_multi_start()
+            return
 
-        result = minimize(func, self.x0, method=self._method, callback=self.callback, **self.options)
+        result = self._minimize(self.x0, self._evaluate, self.callback)
         self._check_result(result)
 
+    def _minimize(self, x0, evaluate: callable, callback: callable):
+        """ One local search from 'x0'; 'evaluate(points)' returns the metrics (and records the evaluations). """
+        sign = -1 if self.problem.type_ == OptimizationType.MAX else 1
+        last = {}  # last evaluated point and value; shared by 'func' and 'jac' so neither evaluates it again
+
+        def func(x):
+            if last.get("from_jac") and np.array_equal(last["x"], x):
+                last["from_jac"] = False
+                return last["value"]
+            value = sign * evaluate([x])[0]
+            last.update(x=np.array(x, dtype=float), value=value, from_jac=False)
+            return value
+
+        options = self.options
+        if self.parallel and options.get("jac") == "2-point":
+            def jac(x):
+                x = np.array(x, dtype=float)
+                known = "x" in last and np.array_equal(last["x"], x)
+                gradient, value = self._finite_difference(x, sign, evaluate, last["value"] if known else None)
+                if not known:
+                    last.update(x=x, value=value, from_jac=True)
+                return gradient
+
+            options = options | {"jac": jac}
+
+        return minimize(func, x0, method=self._method, callback=callback, **options)
+
+    def _evaluate(self, points: list) -> list:
+        """ Metrics of 'points'; evaluations are kept in 'problem._temp_data' until the next callback. """
+        if len(points) == 1:
+            return [self.problem.evaluate_capture(points[0])]
+
+        metrics = []
+        for point, result in zip(points, self._get_executor().map(points)):
+            data_point = self._to_data_point(point, result)
+            self.problem._temp_data.append(data_point)
+            metrics.append(data_point.metric[0])
+        return metrics
+
+    @staticmethod
+    def _finite_difference(x: np.ndarray, sign: int, evaluate: callable, f0: float = None) \
+            -> tuple[np.ndarray, float]:
+        """
+        Forward difference gradient (steps as SciPy's "2-point") of 'sign * metric', and 'f0'. The stencil points
+        (and 'x' if 'f0' is not known) are evaluated in one call to 'evaluate'.
+        """
+        step = np.sqrt(np.finfo(float).eps) * np.where(x >= 0, 1, -1) * np.maximum(1, np.abs(x))
+        step = (x + step) - x  # exactly representable steps
+
+        points = [x + np.diag(step)[i] for i in range(len(x))]
+        if f0 is None:
+            points.insert(0, x)
+
+        values = [sign * metric for metric in evaluate(points)]
+        if f0 is None:
+            f0 = values.pop(0)
+        return (np.array(values) - f0) / step, f0
+
+    def _get_start_points(self) -> np.ndarray:
+        if not isinstance(self.starts, int):
+            return np.atleast_2d(np.asarray(self.starts, dtype=float))
+
+        designs = {"sobol": qmc.Sobol, "lhs": qmc.LatinHypercube}
+        if self.start_design not in designs:
+            raise ValueError(f"Invalid 'start_design': {self.start_design} (options: {list(designs)})")
+
+        num = max(self.starts - 1, 0)
+        sampler = designs[self.start_design](d=self.problem.num_variables, seed=self.seed)
+        if isinstance(sampler, qmc.Sobol):
+            samples = sampler.random_base2(int(np.ceil(np.log2(max(num, 1)))))[:num]  # balanced: power of 2
+        else:
+            samples = sampler.random(num)
+        points = qmc.scale(
+            samples,
+            [var.min_ for var in self.problem.variables],
+            [var.max_ for var in self.problem.variables]
+        )
+        return np.vstack([np.asarray(self.x0, dtype=float)[np.newaxis], points])
+
+    def _run_multi_start(self):
+        self.start_points = self._get_start_points()
+        if self.parallel:
+            executor = self._get_executor()
+        else:
+            executor = ExecutorInline()
+            executor.start(self.problem)
+
+        searches = [partial(self._minimize, x0) for x0 in self.start_points]
+        self.start_results, _ = run_local_searches(self, searches, executor, tags=self.start_of_evaluation)
+        for result in self.start_results:
+            if result is not None:
+                self._check_result(result)
+
     def callback(self, *args, **kwargs):
         self.iteration_count += 1
         for i in range(len(self.problem._temp_data)):
@@ -1,11 +1,14 @@
+import numpy as np
 from scipy import optimize
 
 from flex_optimization import OptimizationType, NotSupported
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.utils import save_if_error
 from flex_optimization.core.variable import DiscreteVariable
 from flex_optimization.core.problem import Problem
 from flex_optimization.core.method_subclass import ActiveMethod, StopCriteria
+from flex_optimization.methods.active_methods.scipy._parallel import run_local_searches
 from flex_optimization.stop_criteria import StopIterationEvaluation, StopAbsoluteChange, StopRelativeChange, \
     StopFunctionEvaluation
 
@@ -16,6 +19,16 @@ class MethodBasinHopping(ActiveMethod):
 
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.basinhopping.html#scipy.optimize.basinhopping
 
+    When run in parallel ('multiprocess' or 'executor'), every hop minimizes 'candidates' random displacements of
+    the current minimum side by side (their evaluations done by the executor; see 'run_local_searches'). The
+    candidates are tried from the lowest minimum up with the Metropolis criterion and the first one accepted
+    becomes the current minimum. 'niter', 'T', 'stepsize', 'minimizer_kwargs' and 'seed' of 'options' are used.
+
+    Parameters
+    ----------
+    candidates: int
+        local minimizations per hop when run in parallel (default: 'max_workers' of the executor)
+
     """
 
     def __init__(self,
@@ -25,13 +38,16 @@ class MethodBasinHopping(ActiveMethod):
                  multiprocess: bool | int = False,
                  recorder: Recorder = None,
                  options: dict = None,
-                 _method: str = None):
+                 _method: str = None,
+                 executor: Executor | str = None,
+                 candidates: int = None):
 
         self.x0 = x0
         self.options = options if options is not None else {}
         self._method = _method
+        self.candidates = candidates
 
-        super().__init__(problem, stop_criterion, multiprocess, recorder)
+        super().__init__(problem, stop_criterion, multiprocess, recorder, executor=executor)
 
     def method_init(self):
         self._flag_init = True
@@ -55,6 +71,10 @@ class MethodBasinHopping(ActiveMethod):
         if not self._flag_init:
             self.method_init()
 
+        if self.parallel:
+            self._run_parallel()
+            return
+
         if self.problem.type_ == OptimizationType.MAX:
             def maximize_func(*args, **kwargs):
                 return -1 * self.problem.evaluate_capture(*args, **kwargs)
@@ -66,6 +86,47 @@ class MethodBasinHopping(ActiveMethod):
         result = optimize.basinhopping(func, x0=self.x0, callback=self.callback, **self.options)
         self._check_result(result)
 
+    def _run_parallel(self):
+        executor = self._get_executor()
+        num_candidates = self.candidates if self.candidates is not None else executor.max_workers
+        rng = np.random.default_rng(self.options.get("seed"))
+        temperature = self.options.get("T", 1.0)
+        stepsize = self.options.get("stepsize", 0.5)
+        minimizer_kwargs = self.options.get("minimizer_kwargs", {})
+        sign = -1 if self.problem.type_ == OptimizationType.MAX else 1
+
+        def local_search(x0):
+            def search(evaluate, callback):
+                return optimize.minimize(lambda x: sign * evaluate([x])[0], x0, **minimizer_kwargs)
+            return search
+
+        (current,), stopped = run_local_searches(self, [local_search(np.asarray(self.x0, dtype=float))], executor)
+        failures = int(not current.success) if current is not None else 0
+        for _ in range(self.options.get("niter", 100)):
+            if stopped:
+                break
+            candidates = [current.x + rng.uniform(-stepsize, stepsize, current.x.shape) for _ in range(num_candidates)]
+            results, stopped = run_local_searches(self, [local_search(x) for x in candidates], executor)
+            results = [result for result in results if result is not None]
+            failures += sum(not result.success for result in results)
+            current = self._metropolis(current, results, temperature, rng)
+
+            self.iteration_count += 1
+            stopped = stopped or not self._check_stop_criterion()
+
+        if failures:
+            self.recorder.record(self.recorder.WARNING, text=f"SciPy: {failures} local minimizations failed")
+
+    @staticmethod
+    def _metropolis(current, results: list, temperature: float, rng: np.random.Generator):
+        """ The first candidate (from the lowest minimum up) accepted by the Metropolis criterion, else 'current'. """
+        for result in sorted(results, key=lambda result_: result_.fun):
+            if result.fun < current.fun:
+                return result
+            if temperature > 0 and rng.random() < np.exp(-(result.fun - current.fun) / temperature):
+                return result
+        return current
+
     def callback(self, *args, **kwargs):
         self.iteration_count += 1
         for i in range(len(self.problem._temp_data)):
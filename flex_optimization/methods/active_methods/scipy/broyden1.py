@@ -2,6 +2,7 @@ import numpy as np
 from scipy import optimize
 
 from flex_optimization import OptimizationType, NotSupported
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.variable import DiscreteVariable
 from flex_optimization.core.problem import Problem
@@ -23,13 +24,14 @@ class MethodBroyden(ActiveMethod):
                  multiprocess: bool | int = False,
                  recorder: Recorder = None,
                  options: dict = None,
-                 _method: str = None):
+                 _method: str = None,
+                 executor: Executor | str = None):
 
         self.x0 = x0
         self.options = options if options is not None else {}
         self._method = _method
 
-        super().__init__(problem, stop_criterion, multiprocess, recorder)
+        super().__init__(problem, stop_criterion, multiprocess, recorder, executor=executor)
 
     def method_init(self):
         self._flag_init = True
@@ -1,6 +1,7 @@
 import numpy as np
 
 from flex_optimization.core.problem import Problem
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.stop_criteria import StopCriteria
 from flex_optimization.methods import MethodType, MethodClassification
@@ -28,9 +29,14 @@ class MethodNelderMead(SciPyBase):
                  x0: list | tuple | np.ndarray,
                  multiprocess: bool | int = False,
                  recorder: Recorder = None,
-                 options: dict = None):
+                 options: dict = None,
+                 executor: Executor | str = None,
+                 starts: int | list | np.ndarray = None,
+                 start_design: str = "sobol",
+                 seed: int = None):
         _method = "Nelder-Mead"
-        super().__init__(problem, stop_criterion, x0, multiprocess, recorder, options, _method)
+        super().__init__(problem, stop_criterion, x0, multiprocess, recorder, options, _method, executor=executor,
+                         starts=starts, start_design=start_design, seed=seed)
 
     def method_init(self):
         super().method_init()
@@ -7,6 +7,7 @@ import scipy
 from scipy.optimize import minimize
 
 from flex_optimization import OptimizationType, NotSupported
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.utils import save_if_error
 from flex_optimization.core.variable import DiscreteVariable
@@ -77,14 +78,15 @@ class MethodHillClimber(ActiveMethod, ABC):
                  multiprocess: bool | int = False,
                  recorder: Recorder = None,
                  options: dict = None,
-                 _method: str = None):
+                 _method: str = None,
+                 executor: Executor | str = None):
 
         self.x0 = x0
         self.n_neighbours = n_neighbours # 3
         self.options = options if options is not None else {}
         self._method = _method
 
-        super().__init__(problem, stop_criterion, multiprocess, recorder)
+        super().__init__(problem, stop_criterion, multiprocess, recorder, executor=executor)
 
     def method_init(self):
         self._flag_init = True
@@ -2,6 +2,7 @@ import itertools
 
 import numpy as np
 
+from flex_optimization.core.executor import Executor
 from flex_optimization.core.recorder import Recorder
 from flex_optimization.core.variable import ContinuousVariable, DiscreteVariable
 from flex_optimization.core.problem import Problem
@@ -14,11 +15,12 @@ class MethodMultiCovariance(PassiveMethod):
                  problem: Problem,
                  levels: int | list[int] | tuple[int],
                  multiprocess: bool | int = False,
-                 recorder: Recorder = None):
+                 recorder: Recorder = None,
+                 executor: Executor | str = None):
 
         self._check_levels(levels)
         self.levels = levels
-        super().__init__(problem, multiprocess, recorder)
+        super().__init__(problem, multiprocess, recorder, executor=executor)
 
     @staticmethod
     def _check_levels(levels):
@@ -3,6 +3,7 @@ import numpy as np
 
 from flex_optimization import OptimizationType
 from flex_optimization.problems import ProblemClassification
+from flex_optimization.problems.utils import as_columns
 
 
 def ackley(args: list[float]) -> float:
@@ -21,22 +22,21 @@ def ackley(args: list[float]) -> float:
 
     Parameters
     ----------
-    args: list[float]
+    args: list[float] | np.ndarray
         [x, y, z, ...] (length determines dimensionality)
+        or an array (n, d) of n points
 
     Returns
     -------
-    return: float
-        z value
+    return: float | np.ndarray
+        z value (an array (n,) for n points)
 
     """
-    d = len(args)
+    x = as_columns(args)
+    d = x.shape[0]
 
-    first_sum = 0
-    second_sum = 0
-    for i in range(d):
-        first_sum += args[i]**2
-        second_sum += np.cos(2 * np.pi * args[i])
+    first_sum = np.sum(x**2, axis=0)
+    second_sum = np.sum(np.cos(2 * np.pi * x), axis=0)
 
     return -20.0*np.exp(-0.2*np.sqrt(first_sum/d)) - np.exp(second_sum/d) + 20 + np.e
 
@@ -1,9 +1,8 @@
-import math
-
 import numpy as np
 
 from flex_optimization import OptimizationType
 from flex_optimization.problems import ProblemClassification
+from flex_optimization.problems.utils import as_columns
 
 
 def nd_gaussian(args: list[float],
@@ -20,8 +19,9 @@ def nd_gaussian(args: list[float],
 
     Parameters
     ----------
-    args: list[float]
+    args: list[float] | np.ndarray
         [x, y, z, ...] (length determines dimensionality)
+        or an array (n, d) of n points
     sigma: float, list[float]
         standard deviation
     pre_factor: float
@@ -31,11 +31,12 @@ def nd_gaussian(args: list[float],
 
     Returns
     -------
-    return: float
-        z value
+    return: float | np.ndarray
+        z value (an array (n,) for n points)
 
     """
-    d = len(args)
+    x = as_columns(args)
+    d = x.shape[0]
 
     if sigma is not None:
         if len(sigma) != d:
@@ -49,15 +50,10 @@ def nd_gaussian(args: list[float],
     else:
         center = [0] * d
 
-    def single_dim_exponent(x_, x0, sigma_):
-        return (x_-x0)**2/(2*sigma_**2)
-
-    if d == 1:
-        return pre_factor*math.exp(-single_dim_exponent(args[0], center, sigma))
-
-    exponent = 0
-    for i in range(d):
-        exponent += single_dim_exponent(args[i], center[i], sigma[i])
+    shape = (d,) + (1,) * (x.ndim - 1)  # broadcast over the points
+    sigma = np.asarray(sigma, dtype=np.float64).reshape(shape)
+    center = np.asarray(center, dtype=np.float64).reshape(shape)
+    exponent = np.sum((x - center)**2 / (2 * sigma**2), axis=0)
 
     return pre_factor*np.exp(-exponent)
 
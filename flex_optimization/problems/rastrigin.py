@@ -3,7 +3,7 @@ import numpy as np
 
 from flex_optimization import OptimizationType
 from flex_optimization.problems import ProblemClassification
-from flex_optimization.problems.utils import to_numpy_array
+from flex_optimization.problems.utils import as_columns
 
 
 def rastrigin(args: list[float], constant: float = 10) -> float:
@@ -20,21 +20,21 @@ def rastrigin(args: list[float], constant: float = 10) -> float:
 
     Parameters
     ----------
-    args: list[float]
+    args: list[float] | np.ndarray
         [x, y, z, ...] (length determines dimensionality)
+        or an array (n, d) of n points
     constant: float
 
     Returns
     -------
-    return: float
-        z value
+    return: float | np.ndarray
+        z value (an array (n,) for n points)
 
     """
-    d = len(args)
+    x = as_columns(args)
+    d = x.shape[0]
 
-    sum_ = 0
-    for i in range(d):
-        sum_ += args[i]**2 - constant * np.cos(2 * np.pi * args[i])
+    sum_ = np.sum(x**2 - constant * np.cos(2 * np.pi * x), axis=0)
 
     return constant*d + sum_
 
@@ -4,7 +4,7 @@ import numpy as np
 
 from flex_optimization import OptimizationType
 from flex_optimization.problems import ProblemClassification
-from flex_optimization.problems.utils import to_numpy_array
+from flex_optimization.problems.utils import as_columns
 
 
 def rosenbrock(args: list[float], constant: float = 10) -> float:
@@ -22,22 +22,23 @@ def rosenbrock(args: list[float], constant: float = 10) -> float:
     ----------
     args: array
         [x, y, z, ...] (length determines dimensionality)
+        or an array (n, d) of n points
     constant: float
         constant
 
     Returns
     -------
-    return: np.ndarray
-        z value
+    return: float | np.ndarray
+        z value (an array (n,) for n points)
 
     """
-    d = len(args)
+    x = as_columns(args)
+    d = x.shape[0]
     if d % 2 != 0:
         raise ValueError("Rosenbrock requires even dimensions. Use 'rosebrock_varient' for non-even dimensions.")
 
-    sum_ = 0
-    for i in range(1, int(d/2)+1):
-        sum_ += constant * (args[2*i-2]**2 - args[2*i-1])**2 + (args[2*i-2]-1)**2
+    odd, even = x[0::2], x[1::2]  # x_1, x_3, ... and x_2, x_4, ...
+    sum_ = np.sum(constant * (odd**2 - even)**2 + (odd - 1)**2, axis=0)
     return constant*d + sum_
 
 
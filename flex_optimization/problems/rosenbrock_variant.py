@@ -2,6 +2,7 @@ import numpy as np
 
 from flex_optimization import OptimizationType
 from flex_optimization.problems import ProblemClassification
+from flex_optimization.problems.utils import as_columns
 
 
 def rosenbrock_variant(args, constant: float = 10) -> float:
@@ -17,25 +18,25 @@ def rosenbrock_variant(args, constant: float = 10) -> float:
 
     Parameters
     ----------
-    args: list[float
+    args: list[float] | np.ndarray
         [x, y, z, ...] (length determines dimensionality)
+        or an array (n, d) of n points
     constant: float
         constant
 
     Returns
     -------
-    return: float
-        z value
+    return: float | np.ndarray
+        z value (an array (n,) for n points)
 
     """
-    d = len(args)
+    x = as_columns(args)
+    d = x.shape[0]
 
     if 3 < d < 7:
         raise ValueError("Rosenbrock requires even dimensions. Use 'rosebrock_varient' for non-even dimensions.")
 
-    sum_ = 0
-    for i in range(1, d):
-        sum_ += constant * (args[i] - args[i - 1] ** 2) ** 2 + (1 - args[i - 1]) ** 2
+    sum_ = np.sum(constant * (x[1:] - x[:-1] ** 2) ** 2 + (1 - x[:-1]) ** 2, axis=0)
     return constant * d + sum_
 
 
@@ -3,6 +3,7 @@ import numpy as np
 
 from flex_optimization import OptimizationType
 from flex_optimization.problems import ProblemClassification
+from flex_optimization.problems.utils import as_columns
 
 
 def sphere(args: list[float]) -> float:
@@ -21,22 +22,18 @@ def sphere(args: list[float]) -> float:
 
     Parameters
     ----------
-    args: list[float]
+    args: list[float] | np.ndarray
         [x, y, z, ...] (length determines dimensionality)
+        or an array (n, d) of n points
 
     Returns
     -------
-    return: float
-        z value
+    return: float | np.ndarray
+        z value (an array (n,) for n points)
 
     """
-    d = len(args)
-
-    sum_ = 0
-    for i in range(d):
-        sum_ += args[i]**2
-
-    return sum_
+    x = as_columns(args)
+    return np.sum(x**2, axis=0)
 
 
 def goal(d: int):
@@ -1,6 +1,19 @@
 import numpy as np
 
 
+def as_columns(args) -> np.ndarray:
+    """
+    Points as an array with the dimensions on the first axis, so 'x[i]' is the i-th coordinate of every point
+    and reductions over the dimensions are 'np.sum(..., axis=0)'.
+    * [x, y, ...] (list/tuple) of numbers or arrays (n,): one or n points
+    * np.ndarray (d,): one point
+    * np.ndarray (n, d): n points
+    """
+    if isinstance(args, np.ndarray) and args.ndim == 2:
+        return args.T
+    return np.asarray(args, dtype=np.float64)
+
+
 def to_numpy_array(args) -> np.ndarray:
     if not isinstance(args, (list, tuple, np.ndarray)):
         raise ValueError("Invalid args.")
@@ -1,2 +1,4 @@
 from flex_optimization.recorders.basic import RecorderBasic
 from flex_optimization.recorders.full import RecorderFull
+from flex_optimization.recorders.stream import RecorderStream
+from flex_optimization.recorders.bounded import RecorderBounded
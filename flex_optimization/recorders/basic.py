@@ -7,12 +7,11 @@ from flex_optimization.core.logger_ import logger
 
 class RecorderBasic(Recorder):
 
-    def __init__(self, problem=None, method=None):
+    def __init__(self, problem=None, method=None, top_k: int = 10):
         self.start_time = None
         self.end_time = None
         self._first_eval = True
-        self.num_data_points: int = 0
-        super().__init__(problem, method)
+        super().__init__(problem, method, top_k)
         logger.setLevel(logger.INFO)
 
     @property
@@ -53,9 +52,7 @@ class RecorderBasic(Recorder):
 
     def _record_evaluation(self, data_point: DataPoint):
         # save data
-        self.data.append(data_point)
-        self.num_data_points += 1
-        self._up_to_date = False
+        self._store_data_point(data_point)
 
     def _record_setup(self):
         # log problem
@@ -0,0 +1,76 @@
+import math
+
+from flex_optimization.core.data_point import DataPoint
+from flex_optimization.core.data_store import RingDataStore
+from flex_optimization.recorders.basic import RecorderBasic
+
+
+class RecorderBounded(RecorderBasic):
+    """
+    Recorder: Bounded
+
+    Keeps a fixed amount of memory however long the run is:
+    * aggregate statistics of the metric (count, mean, std, min, max)
+    * the best evaluation and the 'top_k' best evaluations
+    * the last 'window' evaluations (ring buffer); 'data' and 'df' only contain this window
+
+    All stop criteria only need the counters, the best value or the most recent evaluations, so they work as with
+    the other recorders.
+
+    Parameters
+    ----------
+    top_k: int
+        number of best evaluations kept
+    window: int
+        number of most recent evaluations kept
+
+    """
+    bounded_data = True
+
+    def __init__(self, problem=None, method=None, top_k: int = 10, window: int = 1000):
+        self.window = window
+        self._metric_count = 0
+        self._metric_mean = 0.0
+        self._metric_m2 = 0.0  # sum of squared differences from the mean (Welford)
+        self._metric_min = math.inf
+        self._metric_max = -math.inf
+        super().__init__(problem, method, top_k)
+        self.data = RingDataStore(capacity=window)
+
+    @property
+    def statistics(self) -> dict:
+        """ Aggregate statistics of the metric over every evaluation (NaN metrics are not counted). """
+        std = math.sqrt(self._metric_m2 / (self._metric_count - 1)) if self._metric_count > 1 else math.nan
+        return dict(
+            count=self._metric_count,
+            mean=self._metric_mean if self._metric_count else math.nan,
+            std=std,
+            min=self._metric_min,
+            max=self._metric_max
+        )
+
+    def _record_evaluation(self, data_point: DataPoint):
+        self._store_data_point(data_point)
+        self._update_statistics(data_point.metric[0])
+
+    def _update_statistics(self, metric: float):
+        if metric != metric:  # NaN
+            return
+
+        self._metric_count += 1
+        delta = metric - self._metric_mean
+        self._metric_mean += delta / self._metric_count
+        self._metric_m2 += delta * (metric - self._metric_mean)
+        self._metric_min = min(self._metric_min, metric)
+        self._metric_max = max(self._metric_max, metric)
+
+    def top_k(self, k: int = None) -> list[dict]:
+        """ The 'k' best evaluations, best first; 'k' can't be larger than 'top_k_size' (only the window is kept). """
+        if k is not None and k > self.top_k_size:
+            raise ValueError(f"'k' ({k}) is larger than 'top_k_size' ({self.top_k_size}); only the 'top_k_size' best "
+                             f"evaluations are kept.")
+        return super().top_k(k)
+
+    def _get_best_result(self):
+        """ Only the window is kept, so the tracked best is the only best available. """
+        return None
@@ -7,12 +7,11 @@ from flex_optimization.core.logger_ import logger
 
 
 class RecorderFull(Recorder):
-    def __init__(self, problem=None, method=None):
+    def __init__(self, problem=None, method=None, top_k: int = 10):
         self.start_time = None
         self.end_time = None
         self._first_eval = True
-        self.num_data_points: int = 0
-        super().__init__(problem, method)
+        super().__init__(problem, method, top_k)
         logger.setLevel(logger.DEBUG)
 
     @property
@@ -75,17 +74,15 @@ class RecorderFull(Recorder):
             self._first_eval = False
             self._create_header(data_point.has_metric, show_iteration)
 
-        # save data
-        self.data.append(data_point)
-
         # send data to logger
         mes = f"{self.num_data_points} |"
         if show_iteration:
             mes += f" {self.method.iteration_count} |"
         mes += data_point.__repr__()
         logger.monitor(mes)
-        self.num_data_points += 1
-        self._up_to_date = False
+
+        # save data
+        self._store_data_point(data_point)
 
     def _create_header(self, show_metric: bool = False, show_iteration: bool = False):
         mes = "counter |"
@@ -106,6 +103,8 @@ class RecorderFull(Recorder):
         time.sleep(0.1)  # to ensure all evaluations print first
 
         logger.info(f"Calculation time: {self.duration}")
+        if self.problem.cache is not None:
+            logger.info(repr(self.problem.cache))
         logger.info(f"\nBest Result: {self.best_result}")
 
     @staticmethod
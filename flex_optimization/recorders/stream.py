@@ -0,0 +1,133 @@
+import glob
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from flex_optimization.core.data_point import DataPoint
+from flex_optimization.core.data_store import DataStore
+from flex_optimization.core.logger_ import logger
+from flex_optimization.recorders.basic import RecorderBasic
+
+
+class RecorderStream(RecorderBasic):
+    """
+    Recorder: Stream
+
+    Streams evaluations to disk in fixed-size batches, so memory use stays flat however long the run is.
+    Only the current batch (at most 'batch_size' evaluations), the running best and the top-k are kept in memory.
+    Each batch is written as one '.npz' chunk (one array per column) into 'directory'; chunks are written to a
+    temporary file and renamed, so a crash loses at most the batch in memory.
+
+    Parameters
+    ----------
+    directory: str
+        folder the chunks are written to (default: 'stream_<date>-<time>' in the working directory)
+    batch_size: int
+        number of evaluations per chunk
+
+    """
+    bounded_data = True
+
+    def __init__(self, problem=None, method=None, top_k: int = 10, directory: str = None, batch_size: int = 10_000):
+        if directory is None:
+            directory = f"stream_{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        self.directory = directory
+        self.batch_size = batch_size
+        self.num_chunks = 0
+        self._columns: list[str] | None = None  # fixed by the first chunk
+        super().__init__(problem, method, top_k)
+        self.data = DataStore(capacity=batch_size)
+
+    def _error_exit(self, e):
+        """ Flush the in-memory batch so everything recorded up to the error is on disk. """
+        self._error = e
+        if len(self.data) > 0:
+            self.flush()
+        logger.error(f"Error Occurred!!!!!!!! Data streamed to '{self.directory}'")
+        raise e
+
+    def _resume(self):
+        """ Remove chunks written after the checkpoint; those evaluations will be repeated. """
+        for file_name in glob.glob(os.path.join(self.directory, "chunk_*.npz")):
+            if int(os.path.basename(file_name)[6:12]) >= self.num_chunks:
+                os.remove(file_name)
+
+    def _record_evaluation(self, data_point: DataPoint):
+        self._store_data_point(data_point)
+        if len(self.data) >= self.batch_size:
+            self.flush()
+
+    def _record_finish(self):
+        if len(self.data) > 0:
+            self.flush()
+        super()._record_finish()
+
+    def flush(self):
+        """ Write the in-memory batch to a new chunk and start an empty batch. """
+        if len(self.data) == 0:
+            return
+
+        if self.num_chunks == 0:
+            if glob.glob(os.path.join(self.directory, "chunk_*.npz")):
+                raise FileExistsError(f"'{self.directory}' already contains chunks from another run.")
+            os.makedirs(self.directory, exist_ok=True)
+            self._write_metadata()
+
+        file_name = os.path.join(self.directory, f"chunk_{self.num_chunks:06d}.npz")
+        temp_file_name = file_name + ".tmp"
+        with open(temp_file_name, "wb") as file:
+            np.savez(file, **self.data.arrays())
+        os.replace(temp_file_name, file_name)
+
+        self.num_chunks += 1
+        self.data = DataStore(capacity=self.batch_size)
+
+    def _write_metadata(self):
+        self._columns = self._get_dataframe_column_names()
+        metadata = dict(
+            columns=self._columns,
+            has_iteration=self.data.has_iteration,
+            has_metric=self.data.has_metric,
+            batch_size=self.batch_size
+        )
+        with open(os.path.join(self.directory, "metadata.json"), "w", encoding="UTF-8") as file:
+            json.dump(metadata, file)
+
+    def read_data(self) -> DataStore:
+        """ Read every chunk on disk plus the in-memory batch into a single DataStore. """
+        if self.num_chunks == 0:
+            return self.data
+
+        columns = {}
+        for file_name in sorted(glob.glob(os.path.join(self.directory, "chunk_*.npz"))):
+            with np.load(file_name, allow_pickle=True) as chunk:
+                for key in chunk.files:
+                    columns.setdefault(key, []).append(chunk[key])
+        if len(self.data) > 0:
+            for key, value in self.data.arrays().items():
+                columns.setdefault(key, []).append(value)
+
+        with open(os.path.join(self.directory, "metadata.json"), encoding="UTF-8") as file:
+            metadata = json.load(file)
+        columns = {key: np.concatenate(value) for key, value in columns.items()}
+        return DataStore.from_arrays(has_iteration=metadata["has_iteration"], **columns)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """ DataFrame of all evaluations (reads every chunk from disk). """
+        if self._df is None or self._df_length < self.num_data_points:
+            if self.num_data_points == 0:
+                raise Exception("Error occurred. No data present to generate data frame. "
+                                "Did you forget to 'run' the optimization?")
+            self._df = self.read_data().to_dataframe(self.problem.variable_names)
+            self._df_length = self.num_data_points
+
+        return self._df
+
+    def _get_dataframe_column_names(self) -> list[str]:
+        if self._columns is not None:
+            return self._columns
+        return super()._get_dataframe_column_names()
@@ -19,8 +19,27 @@ class StopComputationTime(StopCriteria):
     def __repr__(self):
         return f"{type(self).__name__} | duration: {self.duration}"
 
+    def __getstate__(self) -> dict:
+        """ monotonic time is only valid within a process, so the elapsed and remaining times are saved instead. """
+        state = self.__dict__.copy()
+        state["start_time"] = time.monotonic() - self.start_time
+        state["stop_time"] = self.stop_time - time.monotonic()
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.start_time = time.monotonic() - self.start_time
+        self.stop_time = time.monotonic() + self.stop_time
+
     def evaluate(self, *args, **kwargs) -> bool:
         if self.stop_time < time.monotonic():
             return False
 
         return True
+
+    def remaining(self, method) -> int | None:
+        """ Estimated from the evaluations per second since the start. """
+        elapsed = time.monotonic() - self.start_time
+        if method.recorder.num_data_points == 0 or elapsed <= 0:
+            return None
+        return max(int((self.stop_time - time.monotonic()) * method.recorder.num_data_points / elapsed), 0)
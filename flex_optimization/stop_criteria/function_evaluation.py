@@ -18,7 +18,10 @@ class StopFunctionEvaluation(StopCriteria):
         return f"{type(self).__name__} | num_eval: {self.current_eval}"
 
     def evaluate(self, method: Method, *args, **kwargs) -> bool:
-        self.current_eval = len(method.recorder.data)
+        self.current_eval = method.recorder.num_data_points
         if self.current_eval >= self.num_eval:
             return False
         return True
+
+    def remaining(self, method: Method) -> int:
+        return max(self.num_eval - method.recorder.num_data_points, 0)
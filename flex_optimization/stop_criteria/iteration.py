@@ -22,3 +22,6 @@ class StopIterationEvaluation(StopCriteria):
         if method.iteration_count >= self.num_eval:
             return False
         return True
+
+    def remaining(self, method: ActiveMethod) -> int:
+        return max(self.num_eval - method.iteration_count, 0)
@@ -34,11 +34,11 @@ class StopRate(StopCriteria):
     def evaluate(self, method: Method, *args, **kwargs) -> bool:
         # first iterations
         if len(self.data) < self.prior_steps:
-            self.data.append(method.recorder.data[-1][-1])
+            self.data.append(method.recorder.last_metric)
             return True
 
         self.data.pop(0)
-        self.data.append(method.recorder.data[-1][-1])
+        self.data.append(method.recorder.last_metric)
         slope = _linear_regression(self._x, np.array(self.data))
 
         # max
@@ -26,13 +26,16 @@ class StopRelativeChange(StopCriteria):
         return f"{type(self).__name__} | cut_off_value: {self.cut_off_value}; cut_off_steps: {self.cut_off_steps}"
 
     def evaluate(self, method: Method, *args, **kwargs) -> bool:
-        # first iteration
+        new_point = method.recorder.best_metric
+        if new_point is None:  # only NaN or failed evaluations so far
+            return self._no_improvement()
+
+        # first iteration (with a best value)
         if self.best is None:
-            self.best = method.recorder.data[-1][-1]
+            self.best = new_point
+            self.current_cut_off_steps = 0
             return True
 
-        new_point = method.recorder.data[-1][-1]
-
         # max
         if method.problem.type_ == OptimizationType.MAX:
             return self._evaluate_max(new_point)
@@ -46,11 +49,7 @@ class StopRelativeChange(StopCriteria):
             self.current_cut_off_steps = 0  # reset counter
             return True  # continue
 
-        self.current_cut_off_steps += 1
-        if self.current_cut_off_steps == self.cut_off_steps:
-            return False  # stop as too many steps with no improvement
-
-        return True
+        return self._no_improvement()
 
     def _evaluate_min(self, new_point) -> bool:
         if (self.best - new_point)/abs(self.best) > self.cut_off_value:
@@ -58,6 +57,9 @@ class StopRelativeChange(StopCriteria):
             self.current_cut_off_steps = 0  # reset counter
             return True  # continue
 
+        return self._no_improvement()
+
+    def _no_improvement(self) -> bool:
         self.current_cut_off_steps += 1
         if self.current_cut_off_steps == self.cut_off_steps:
             return False  # stop as too many steps with no improvement
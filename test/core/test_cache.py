@@ -0,0 +1,133 @@
+import sys
+import threading
+
+import numpy as np
+
+import flex_optimization as fo
+from flex_optimization.core.cache import EvaluationCache, PersistentCache, problem_fingerprint
+
+
+def test_cache_lru_eviction():
+    cache = EvaluationCache(max_entries=2)
+    for point in ([1.0], [2.0], [1.0], [3.0]):
+        cache.get(point, lambda x: x[0] ** 2)
+
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert [1.0] in cache and [3.0] in cache
+    assert [2.0] not in cache  # least recently used
+
+
+def test_cache_tolerance():
+    cache = EvaluationCache(tolerance=1e-6)
+    cache.get([1.0, 2.0], sum)
+    assert cache.get([1.0 + 1e-9, 2.0], lambda x: -1) == 3.0
+    assert cache.hits == 1
+
+
+def test_cache_int_float_keys():
+    assert EvaluationCache().key([1, np.int64(2)]) == EvaluationCache().key([1.0, 2.0])
+    cache = EvaluationCache(tolerance=1e-6)
+    cache.get([1, 2], sum)
+    assert [1.0, 2.0] in cache
+
+
+def test_cache_hits_are_recorded():
+    calls = []
+
+    def func(args):
+        calls.append(args)
+        return fo.problems.sphere(args)
+
+    problem = fo.Problem(
+        func=func,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        cache=True
+    )
+    method = fo.methods.MethodFactorial(problem, levels=[3, 1])
+    method.run()
+    method.run()  # same grid again
+
+    assert len(calls) == 3
+    assert (problem.cache.hits, problem.cache.misses) == (3, 3)
+    assert method.recorder.num_data_points == 6
+    assert np.array_equal(method.recorder.data.metrics[:3], method.recorder.data.metrics[3:])
+
+
+def test_cache_vectorized():
+    calls = []
+
+    def func(points):
+        calls.append(len(points))
+        return fo.problems.sphere(points)
+
+    problem = fo.Problem(
+        func=func,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        vectorized=True,
+        cache=EvaluationCache()
+    )
+    problem.evaluate_batch([[1, 2], [3, 4]])
+    results = problem.evaluate_batch([[1, 2], [5, 6], [3, 4]])
+
+    assert calls == [2, 1]
+    assert np.array_equal(results, [5, 61, 25])
+
+
+def test_persistent_cache(tmp_path):
+    file_name = str(tmp_path / "cache.db")
+    variables = [fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")]
+    problem = fo.Problem(func=fo.problems.sphere, variables=variables,
+                         cache=PersistentCache(file_name, fingerprint="sphere"))
+    method = fo.methods.MethodFactorial(problem, levels=3, multiprocess=2)  # workers write concurrently
+    method.run()
+    assert len(problem.cache) == 9
+
+    calls = []
+
+    def func(args):
+        calls.append(args)
+        return fo.problems.sphere(args)
+
+    problem = fo.Problem(func=func, variables=variables, cache=PersistentCache(file_name, fingerprint="sphere"))
+    method = fo.methods.MethodFactorial(problem, levels=3)
+    method.run()
+    assert calls == []
+    assert problem.cache.hits == 9
+    assert method.recorder.data.metrics.sum() == 300  # x^2 + y^2 over the grid {-5, 0, 5}^2
+
+
+def test_problem_fingerprint():
+    variables = [fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")]
+    assert problem_fingerprint(fo.Problem(fo.problems.sphere, variables)) == \
+           problem_fingerprint(fo.Problem(fo.problems.sphere, variables))
+    assert problem_fingerprint(fo.Problem(fo.problems.sphere, variables)) != \
+           problem_fingerprint(fo.Problem(fo.problems.ackley, variables))
+
+
+def test_cache_threads():
+    cache = EvaluationCache(max_entries=4)
+    points = [[float(i % 6)] for i in range(20_000)]
+    errors = []
+
+    def work(offset: int):
+        try:
+            for point in points[offset:] + points[:offset]:
+                cache.get(point, lambda x: x[0] ** 2)
+        except Exception as e:
+            errors.append(e)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    try:
+        threads = [threading.Thread(target=work, args=(i * 7,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert cache.hits + cache.misses == 8 * len(points)
+    assert len(cache) <= 4
+    assert cache.memory == sum(size for _, size in cache._entries.values())
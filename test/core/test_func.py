@@ -96,3 +96,78 @@ def test_nparray_return():
     method = fo.methods.MethodFactorial(problem=problem, levels=10)
 
     method.run()
+
+
+def test_vectorized():
+    calls = []
+
+    def func(points: np.ndarray) -> np.ndarray:
+        calls.append(len(points))
+        return fo.problems.nd_gaussian(np.asarray(points))
+
+    variables = [fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")]
+    problem = fo.Problem(func=func, variables=variables, type_=fo.OptimizationType.MAX, vectorized=True)
+    method = fo.methods.MethodFactorial(problem=problem, levels=10)
+    method.run()
+    assert calls == [100]
+
+    reference = fo.methods.MethodFactorial(fo.Problem(func=fo.problems.nd_gaussian, variables=variables), levels=10)
+    reference.run()
+    assert np.allclose(method.recorder.data.metrics, reference.recorder.data.metrics)
+
+
+def test_vectorized_sampler():
+    calls = []
+
+    def func(points: np.ndarray) -> tuple:
+        calls.append(len(points))
+        points = np.asarray(points)
+        return fo.problems.nd_gaussian(points, sigma=[2, 2]), fo.problems.nd_gaussian(points, sigma=[3, 3])
+
+    def metric(args):
+        return args[0] - args[1]
+
+    problem = fo.Problem(
+        func=func,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX,
+        metric=metric,
+        vectorized=True
+    )
+    method = fo.methods.MethodSobol(problem, fo.stop_criteria.StopFunctionEvaluation(64), seed=0)
+    method.run()
+    assert calls == [64]
+    assert method.recorder.num_data_points == 64
+    df = method.recorder.df
+    assert np.allclose(df["metric"], df["inter_0"] - df["inter_1"])
+
+
+def test_vectorized_sampler_open_budget():
+    calls = []
+
+    def func(points: np.ndarray) -> np.ndarray:
+        calls.append(len(points))
+        return fo.problems.nd_gaussian(np.asarray(points))
+
+    problem = fo.Problem(
+        func=func,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        vectorized=True
+    )
+    stop_criteria = [fo.stop_criteria.StopAbsoluteChange(0.01, 20), fo.stop_criteria.StopFunctionEvaluation(1000)]
+    method = fo.methods.MethodSobol(problem, stop_criteria, seed=0)
+    method.run()
+
+    assert calls == [16, 32]  # no known budget: batches start small and double
+    assert method.recorder.num_data_points == sum(calls)  # points past the stop are recorded, not dropped
+
+
+@pytest.mark.parametrize("stop_criteria", [fo.stop_criteria.StopAbsoluteChange(0.01, 5),
+                                           fo.stop_criteria.StopRelativeChange(0.01, 5)])
+def test_change_criteria_all_nan(stop_criteria):
+    problem = fo.Problem(func=lambda args: float("nan"), variables=[fo.ContinuousVariable(-5, 5, name="x")])
+    method = fo.methods.MethodRandom(problem, [stop_criteria, fo.stop_criteria.StopFunctionEvaluation(100)], seed=0)
+    method.run()
+
+    assert method.recorder.best_metric is None
+    assert method.recorder.num_data_points == 5  # no improvement at every step
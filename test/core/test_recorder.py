@@ -0,0 +1,241 @@
+import pytest
+
+import numpy as np
+
+import flex_optimization as fo
+from flex_optimization.core.data_point import DataPoint
+from flex_optimization.core.data_store import DataStore
+
+
+def test_data_store_growth():
+    store = DataStore(capacity=2)
+    for i in range(10):
+        store.append(DataPoint([i, 2 * i], i ** 2, i ** 2, i))
+
+    assert len(store) == 10
+    assert store.points.shape == (10, 2)
+    assert np.array_equal(store.metrics[:, 0], np.arange(10) ** 2)
+    assert store[-1].point == [9, 18]
+    assert store[-1][-1] == 81
+
+
+def test_data_store_object_column():
+    store = DataStore()
+    store.append(DataPoint([1.0, 2.0], 1, 1))
+    store.append(DataPoint([1.0, "a"], 2, 2))
+
+    assert store.points.dtype == object
+    assert store[-1].point == [1.0, "a"]
+
+
+def test_recorder_df():
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX
+    )
+    method = fo.methods.MethodFactorial(problem, levels=5)
+    method.run()
+
+    df = method.recorder.df
+    assert list(df.columns) == ["x", "y", "metric"]
+    assert len(df) == 25
+    assert np.shares_memory(df["metric"].to_numpy(), method.recorder.data.metrics)
+
+
+def test_recorder_df_tracks_new_evaluations():
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX
+    )
+    method = fo.methods.MethodRandom(problem, fo.stop_criteria.StopFunctionEvaluation(100), seed=0)
+    method.run_steps(5)
+    assert len(method.recorder.df) == 5
+
+    method.run_steps(5)
+    assert len(method.recorder.df) == 10
+    assert list(method.recorder.df["iteration"]) == list(range(1, 11))
+
+
+@pytest.mark.parametrize("type_", [fo.OptimizationType.MIN, fo.OptimizationType.MAX])
+def test_recorder_best_result(type_):
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=type_
+    )
+    method = fo.methods.MethodRandom(problem, fo.stop_criteria.StopFunctionEvaluation(50), seed=0)
+    method.run()
+
+    df = method.recorder.df
+    index = df["metric"].idxmax() if type_ == fo.OptimizationType.MAX else df["metric"].idxmin()
+    assert method.recorder.best_index == index
+    assert method.recorder.best_result == pytest.approx(df.iloc[index].to_dict())
+
+
+@pytest.mark.parametrize("type_", [fo.OptimizationType.MIN, fo.OptimizationType.MAX])
+def test_recorder_top_k(type_):
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=type_
+    )
+    recorder = fo.recorders.RecorderBasic(top_k=5)
+    method = fo.methods.MethodRandom(problem, fo.stop_criteria.StopFunctionEvaluation(50), seed=0, recorder=recorder)
+    method.run()
+
+    ascending = type_ == fo.OptimizationType.MIN
+    expected = method.recorder.df.sort_values("metric", ascending=ascending)["metric"].to_numpy()
+    top = method.recorder.top_k(3)
+    assert [row["metric"] for row in top] == pytest.approx(expected[:3])
+    assert top[0] == pytest.approx(method.recorder.best_result)
+    assert len(method.recorder.top_k(20)) == 20
+
+
+@pytest.mark.parametrize("top_k", [10, 2])
+def test_recorder_top_k_ties(top_k):
+    problem = fo.Problem(func=lambda args: abs(args[0]), variables=[fo.ContinuousVariable(-2, 2, name="x")])
+    recorder = fo.recorders.RecorderBasic(top_k=top_k)
+    method = fo.methods.MethodFactorial(problem, levels=5, recorder=recorder)  # x: -2, -1, 0, 1, 2
+    method.run()
+
+    assert [row["x"] for row in recorder.top_k(5)] == [0, -1, 1, -2, 2]  # ties go to the earlier evaluation
+
+
+def test_recorder_stream(tmp_path):
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX
+    )
+    recorder = fo.recorders.RecorderStream(directory=str(tmp_path / "run"), batch_size=16)
+    method = fo.methods.MethodSobol(problem, fo.stop_criteria.StopFunctionEvaluation(40), seed=0, recorder=recorder)
+    method.run_steps(40)
+
+    assert recorder.num_chunks == 2
+    assert len(recorder.data) == 8  # in-memory tail
+    assert recorder.num_data_points == 40
+
+    recorder.flush()
+    df = recorder.df
+    assert len(df) == 40
+    assert list(df["iteration"]) == list(range(1, 41))
+    assert recorder.best_result["metric"] == df["metric"].max()
+
+
+def test_recorder_stream_stop_rate(tmp_path):
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX
+    )
+    recorder = fo.recorders.RecorderStream(directory=str(tmp_path / "run"), batch_size=5)
+    stop_criteria = [fo.stop_criteria.StopFunctionEvaluation(50), fo.stop_criteria.StopRate(0.01, 3, 100)]
+    method = fo.methods.MethodSobol(problem, stop_criteria, seed=0, recorder=recorder)
+    method.run()  # StopRate reads the latest metric right after each chunk is written
+
+    assert recorder.num_data_points == 50
+    assert recorder.last_metric == recorder.df["metric"].iloc[-1]
+
+
+def test_recorder_save_load_npy(tmp_path):
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX
+    )
+    method = fo.methods.MethodFactorial(problem, levels=5)
+    method.run()
+    file_name = str(tmp_path / "run")
+    method.recorder.save(file_name, format_="npy")
+
+    recorder = fo.recorders.RecorderBasic.load(file_name)
+    assert isinstance(recorder.data.points, np.memmap)
+    assert recorder.df.equals(method.recorder.df)
+
+    df = recorder.get_df(["y", "metric"], rows=slice(10, 15))
+    assert list(df.columns) == ["y", "metric"]
+    assert list(df.index) == list(range(10, 15))
+    assert np.array_equal(df["metric"], method.recorder.df["metric"].iloc[10:15])
+
+
+@pytest.mark.parametrize("stop_criteria", [
+    fo.stop_criteria.StopFunctionEvaluation(200),
+    fo.stop_criteria.StopIterationEvaluation(200),
+    fo.stop_criteria.StopComputationTime(10),
+    fo.stop_criteria.StopRelativeChange(0.01, 50),
+    fo.stop_criteria.StopAbsoluteChange(0.01, 50),
+    fo.stop_criteria.StopRate(0.01, 3, 50),
+])
+def test_recorder_bounded(stop_criteria):
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX
+    )
+    recorder = fo.recorders.RecorderBounded(top_k=5, window=16)
+    method = fo.methods.MethodRandom(problem, [stop_criteria, fo.stop_criteria.StopFunctionEvaluation(200)], seed=0,
+                                     recorder=recorder)
+    method.run()
+
+    n = recorder.num_data_points
+    assert len(recorder.data) == min(n, 16)
+    assert recorder.statistics["count"] == n
+    assert recorder.statistics["max"] == recorder.best_metric
+    assert recorder.top_k(1)[0]["metric"] == recorder.best_metric
+    with pytest.raises(ValueError, match="top_k_size"):
+        recorder.top_k(6)  # the window doesn't hold the best evaluations
+    assert list(recorder.df["iteration"]) == list(range(max(n - 16, 0) + 1, n + 1))
+    assert recorder.data[-1].iteration == n
+
+
+class Config:
+    sigma = 2
+
+
+def gaussian_config(args, config: Config, center) -> float:
+    return fo.problems.nd_gaussian(args, sigma=[config.sigma] * 2, center=center)
+
+
+def test_recorder_save_load_kwargs(tmp_path):
+    problem = fo.Problem(
+        func=gaussian_config,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        kwargs=dict(config=Config(), center=np.array([1.0, 1.0]))
+    )
+    method = fo.methods.MethodRandom(problem, fo.stop_criteria.StopFunctionEvaluation(10), seed=0)
+    method.run()
+    file_name = str(tmp_path / "run")
+    with pytest.warns(UserWarning, match="'config'"):
+        method.recorder.save(file_name)
+
+    recorder = fo.recorders.RecorderBasic.load(file_name)
+    assert recorder.problem.kwargs == dict(center=[1.0, 1.0])  # no repr string for 'config'
+    with pytest.raises(TypeError, match="config"):
+        recorder.problem.evaluate([0, 0])  # has to be passed again
+
+
+@pytest.mark.parametrize("format_", ["npy", "csv"])
+def test_recorder_save_load_metadata(tmp_path, format_):
+    problem = fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        type_=fo.OptimizationType.MAX
+    )
+    method = fo.methods.MethodRandom(problem, fo.stop_criteria.StopFunctionEvaluation(30), seed=0)
+    method.run()
+    file_name = str(tmp_path / "run")
+    method.recorder.save(file_name, format_=format_)
+
+    recorder = fo.recorders.RecorderBasic.load(file_name)
+    assert recorder.problem._func is fo.problems.nd_gaussian
+    assert recorder.problem.variable_names == ["x", "y"]
+    assert recorder.problem.type_ == fo.OptimizationType.MAX
+    assert isinstance(recorder.method, fo.methods.MethodRandom)
+    assert recorder.method.seed == 0
+    assert recorder.duration == method.recorder.duration
+    assert recorder.best_result == pytest.approx(method.recorder.best_result)
+    if format_ == "npy":
+        assert recorder.best_index == method.recorder.best_index
+        assert recorder.top_k(3) == pytest.approx(method.recorder.top_k(3))
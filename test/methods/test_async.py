@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import numpy as np
+
+import flex_optimization as fo
+
+
+class InFlight:
+    def __init__(self):
+        self.now = 0
+        self.max = 0
+
+    async def func(self, args) -> float:
+        self.now += 1
+        self.max = max(self.max, self.now)
+        await asyncio.sleep(0.05)  # e.g. waiting on a remote simulation job
+        self.now -= 1
+        return fo.problems.sphere(args)
+
+
+def _problem(func):
+    return fo.Problem(
+        func=func,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")]
+    )
+
+
+def test_async_passive():
+    in_flight = InFlight()
+    start = time.perf_counter()
+    with fo.methods.MethodFactorial(_problem(in_flight.func), levels=5,
+                                    executor=fo.executors.ExecutorAsyncio(4)) as method:
+        method.run()
+
+    assert time.perf_counter() - start < 25 * 0.05 / 2
+    assert in_flight.max == 4
+    expected = fo.methods.MethodFactorial(_problem(fo.problems.sphere), levels=5)
+    expected.run()
+    assert np.array_equal(np.sort(method.recorder.data.metrics, axis=0),
+                          np.sort(expected.recorder.data.metrics, axis=0))
+
+
+def test_async_sampler_default_executor():
+    in_flight = InFlight()
+    with fo.methods.MethodSobol(_problem(in_flight.func), fo.stop_criteria.StopFunctionEvaluation(32),
+                                seed=0) as method:
+        method.run_steps(32)
+        assert isinstance(method._executor, fo.executors.ExecutorAsyncio)
+
+    assert method.recorder.num_data_points == 32
+    assert in_flight.max == 10
+
+
+def test_async_synchronous_call():
+    problem = _problem(InFlight().func)
+    assert problem.evaluate([1, 2]) == 5
+
+
+def test_async_synchronous_call_in_running_loop():
+    problem = _problem(InFlight().func)
+
+    async def caller():  # e.g. a Jupyter cell
+        return problem.evaluate([1, 2])
+
+    assert asyncio.run(caller()) == 5
+
+
+def test_async_close_waits_for_evaluations():
+    results = []
+    executor = fo.executors.ExecutorAsyncio(4)
+    executor.start(_problem(InFlight().func))
+    for point in ([1, 2], [3, 4], [0, 1]):
+        executor.submit(point, callback=results.append, error_callback=results.append)
+    executor.close()
+
+    assert sorted(result for _, result in results) == [1, 5, 25]
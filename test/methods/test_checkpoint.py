@@ -0,0 +1,99 @@
+import os
+import threading
+
+import pytest
+
+import numpy as np
+
+import flex_optimization as fo
+from flex_optimization.core.method import Method
+
+
+def _problem():
+    return fo.Problem(
+        func=fo.problems.nd_gaussian,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")],
+        kwargs=dict(center=[0.2342, 0.1234], sigma=[1, 3]),
+        type_=fo.OptimizationType.MAX
+    )
+
+
+@pytest.mark.parametrize("method_class", [fo.methods.MethodSobol, fo.methods.MethodRandom])
+def test_resume(tmp_path, method_class):
+    reference = method_class(_problem(), fo.stop_criteria.StopFunctionEvaluation(40), seed=1)
+    reference.run()
+
+    method = method_class(_problem(), fo.stop_criteria.StopFunctionEvaluation(40), seed=1)
+    file_name = str(tmp_path / "run")
+    method.enable_checkpoints(file_name, every=10)
+    method.run_steps(25)  # "crash" after 25 steps; last checkpoint is at step 20
+
+    resumed = Method.resume(file_name)
+    assert resumed.iteration_count == 40
+    assert np.array_equal(resumed.recorder.data.points, reference.recorder.data.points)
+
+
+def test_resume_parallel(tmp_path):
+    reference = fo.methods.MethodSobol(_problem(), fo.stop_criteria.StopFunctionEvaluation(40), seed=1)
+    reference.run()
+
+    method = fo.methods.MethodSobol(_problem(), fo.stop_criteria.StopFunctionEvaluation(40), seed=1, multiprocess=2)
+    file_name = str(tmp_path / "run")
+    method.enable_checkpoints(file_name, every=10)
+    method.run_steps(25)  # last checkpoint is at evaluation 20
+    method.close()
+
+    resumed = Method.resume(file_name)
+    resumed.close()
+    assert resumed.recorder.num_data_points == 40
+    points = np.sort(resumed.recorder.data.points, axis=0)
+    assert np.array_equal(points, np.sort(reference.recorder.data.points, axis=0))
+
+
+def test_checkpoint_appends_new_rows(tmp_path):
+    method = fo.methods.MethodSobol(_problem(), fo.stop_criteria.StopFunctionEvaluation(1000), seed=1)
+    file_name = str(tmp_path / "run")
+    method.enable_checkpoints(file_name, every=100)
+    method.run_steps(200)
+    state_size = os.path.getsize(f"{file_name}.checkpoint")
+    rows_size = os.path.getsize(f"{file_name}.checkpoint.rows")
+    method.run_steps(400)  # 4 more checkpoints
+
+    assert os.path.getsize(f"{file_name}.checkpoint") < state_size + 1000  # evaluations aren't in the state file
+    assert os.path.getsize(f"{file_name}.checkpoint.rows") > 2.5 * rows_size  # 600 rows, in 6 appends
+
+    resumed = Method.resume(file_name, run=False)
+    assert np.array_equal(resumed.recorder.data.points, method.recorder.data.points)
+    resumed.run()
+    assert resumed.recorder.num_data_points == 1000
+
+
+def test_resume_bounded_window(tmp_path):
+    reference = fo.methods.MethodSobol(_problem(), fo.stop_criteria.StopFunctionEvaluation(40), seed=1)
+    reference.run()
+
+    recorder = fo.recorders.RecorderBounded(window=16)
+    method = fo.methods.MethodSobol(_problem(), fo.stop_criteria.StopFunctionEvaluation(40), seed=1,
+                                    recorder=recorder)
+    file_name = str(tmp_path / "run")
+    method.enable_checkpoints(file_name, every=5)
+    method.run_steps(8)  # checkpoint at 5 evaluations, before the window is full
+
+    resumed = Method.resume(file_name)
+    assert resumed.recorder.data._capacity == 16
+    assert np.array_equal(resumed.recorder.data.points, reference.recorder.data.points[-16:])
+
+
+def test_checkpoint_failure_continues(tmp_path):
+    method = fo.methods.MethodSobol(_problem(), fo.stop_criteria.StopFunctionEvaluation(40), seed=1)
+    file_name = str(tmp_path / "run")
+    method.enable_checkpoints(file_name, every=10)
+    method.run_steps(10)
+    method.lock = threading.Lock()  # can't be pickled, so later checkpoints fail
+    method.run()
+
+    assert method.recorder.num_data_points == 40  # the run isn't stopped by the failed checkpoints
+    assert not os.path.exists(f"{file_name}.checkpoint.tmp")
+    resumed = Method.resume(file_name, run=False)  # the last good checkpoint is kept
+    assert resumed.iteration_count == 10
+    assert len(resumed.recorder.data) == 10
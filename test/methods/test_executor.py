@@ -0,0 +1,397 @@
+import os
+import pickle
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import flex_optimization as fo
+from flex_optimization.core.utils import PoolHandler
+
+
+def worker_pid(args) -> float:
+    return os.getpid()
+
+
+def _problem(func=fo.problems.nd_gaussian):
+    return fo.Problem(
+        func=func,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")]
+    )
+
+
+@pytest.mark.parametrize("executor", ["process", "thread", "inline", "asyncio"])
+def test_executor_passive(executor):
+    serial = fo.methods.MethodFactorial(_problem(), levels=5)
+    serial.run()
+
+    with fo.methods.MethodFactorial(_problem(), levels=5, multiprocess=2, executor=executor) as method:
+        method.run()
+        assert method._executor.max_workers == 2
+
+    assert np.array_equal(np.sort(method.recorder.data.metrics, axis=0), np.sort(serial.recorder.data.metrics, axis=0))
+    assert not method._executor
+
+
+@pytest.mark.parametrize("executor", ["process", "thread", "inline", "asyncio"])
+def test_executor_sampler(executor):
+    with fo.methods.MethodSobol(_problem(), fo.stop_criteria.StopFunctionEvaluation(20), seed=0,
+                                executor=executor) as method:
+        method.run_steps(10)
+        executor_ = method._executor
+        method.run_steps(10)
+        assert method._executor is executor_ and executor_.running  # kept warm between steps
+        assert method.recorder.num_data_points == 20
+
+    assert not executor_.running
+
+
+def test_shared_process_executor():
+    problem = _problem(worker_pid)
+    with fo.executors.ExecutorProcess(2) as executor:
+        method = fo.methods.MethodFactorial(problem, levels=4, executor=executor)
+        method.run()
+        pids = {worker.process.pid for worker in executor._workers}
+        assert set(method.recorder.df["metric"]) <= pids
+
+        method = fo.methods.MethodSobol(problem, fo.stop_criteria.StopFunctionEvaluation(16), seed=0,
+                                        executor=executor)
+        method.run_steps(16)
+        assert set(method.recorder.df["metric"]) <= pids  # same warm workers
+        assert len(pids) == 2
+
+    assert not executor.running
+
+
+def test_thread_executor_records_in_calling_thread():
+    threads = set()
+
+    class Recorder(fo.recorders.RecorderBasic):
+        def _record_evaluation(self, data_point):
+            threads.add(threading.get_ident())
+            super()._record_evaluation(data_point)
+
+    method = fo.methods.MethodFactorial(_problem(), levels=5, executor=fo.executors.ExecutorThread(4),
+                                        recorder=Recorder())
+    method.run()
+    assert threads == {threading.get_ident()}
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_pool_handler_chunks(chunk_size):
+    points = [[float(i), float(-i)] for i in range(50)]
+    problem = _problem()
+    results = []
+    with fo.executors.ExecutorProcess(2) as executor:
+        executor.start(problem)
+        handler = PoolHandler(executor=executor, pool_points=points, callback=results.append, chunk_size=chunk_size)
+        handler.run()
+
+    assert sorted(results) == sorted((point, problem.evaluate(point)) for point in points)
+    assert handler._next == len(points)
+    if chunk_size is None:
+        assert handler._time_per_point is not None  # measured for the adaptive size
+
+
+def sum_columns(points) -> np.ndarray:
+    return np.asarray(points).sum(axis=1)
+
+
+def label(args) -> tuple:
+    return args[0], "label"
+
+
+@pytest.mark.parametrize("func, vectorized", [(fo.problems.nd_gaussian, False), (sum_columns, True), (label, False)])
+def test_pool_handler_shared_memory(func, vectorized):
+    problem = fo.Problem(func, [fo.ContinuousVariable(-5, 5) for _ in range(3)], vectorized=vectorized)
+    points = np.random.default_rng(0).uniform(-5, 5, (40, 3))
+    results = []
+    with fo.executors.ExecutorProcess(2) as executor:
+        executor.start(problem)
+        handler = PoolHandler(executor=executor, pool_points=points, callback=results.append)
+        assert handler._numeric()
+        handler.run()
+
+    expected = problem.evaluate_batch(points) if vectorized else [problem.evaluate(point) for point in points]
+    results = sorted(results)
+    assert [point for point, _ in results] == sorted(points.tolist())
+    assert sorted(np.asarray(expected).tolist()) == sorted(np.asarray([result for _, result in results]).tolist())
+
+
+def test_shared_array_name_reused():
+    from multiprocessing import shared_memory
+    from flex_optimization.core.shared_array import SharedArray
+
+    first = SharedArray((3,), data=[1, 2, 3])
+    reference = pickle.loads(pickle.dumps(first))  # as sent to a worker
+    assert reference.attach().tolist() == [1, 2, 3]
+
+    first._shm.unlink()  # the parent frees the segment and a new one gets the same name (the worker isn't told)
+    second = shared_memory.SharedMemory(name=first.name, create=True, size=3 * 8)
+    try:
+        np.ndarray((3,), buffer=second.buf)[:] = [7, 8, 9]
+        reference = SharedArray.__new__(SharedArray)
+        reference.__setstate__(dict(name=first.name, shape=(3,), dtype="<f8", generation=(os.getpid(), -1)))
+        assert reference.attach().tolist() == [7, 8, 9]  # not the stale mapping
+    finally:
+        SharedArray._detach(next(key for key in SharedArray._attached if key[0] == first.name))
+        second.close()
+        second.unlink()
+        del first.array
+        first._shm.close()
+
+
+@pytest.mark.parametrize("method_class", [fo.methods.MethodBFGS, fo.methods.MethodTrustConstraint])
+def test_parallel_finite_difference(method_class):
+    def run(executor):
+        problem = fo.Problem(fo.problems.nd_gaussian, [fo.ContinuousVariable(-5, 5), fo.ContinuousVariable(-5, 5)],
+                             kwargs=dict(center=[0.2342, 0.1234], sigma=[1, 3]), type_=fo.OptimizationType.MAX)
+        with method_class(problem, fo.stop_criteria.StopFunctionEvaluation(200), x0=[1, 1],
+                          executor=executor) as method:
+            method.run()
+        return method.recorder.df
+
+    serial, parallel = run(None), run("thread")
+    assert len(parallel) == len(serial)  # every stencil point is recorded
+    assert np.allclose(parallel.iloc[-1, -3:-1], serial.iloc[-1, -3:-1], atol=1e-5)
+    assert np.allclose(parallel.iloc[-1, -3:-1], [0.2342, 0.1234], atol=1e-3)
+
+
+def test_multi_start(tmp_path):
+    problem = _problem(fo.problems.rastrigin)
+    starts = [[4, 4], [-4, 4], [4, -4], [-4, -4], [1, 1]]
+    with fo.executors.ExecutorThread(len(starts)) as executor:
+        method = fo.methods.MethodNelderMead(problem, fo.stop_criteria.StopFunctionEvaluation(100), x0=[0, 0],
+                                             executor=executor, starts=starts)
+        method.run()
+
+    assert method.recorder.num_data_points == 100  # the group stops together
+    assert len(method.start_of_evaluation) == 100
+    assert set(method.start_of_evaluation) == set(range(len(starts)))  # searches run side by side
+    assert list(method.recorder.df["start"]) == method.start_of_evaluation
+
+    for format_ in ("npy", "csv"):  # the start of each evaluation is saved with the data
+        method.recorder.save(str(tmp_path / format_), format_=format_)
+        loaded = fo.recorders.RecorderBasic.load(str(tmp_path / format_))
+        assert list(loaded.df["start"]) == method.start_of_evaluation
+
+
+@pytest.mark.parametrize("start_design", ["sobol", "lhs"])
+def test_multi_start_design(start_design):
+    problem = _problem(fo.problems.rastrigin)
+    method = fo.methods.MethodBFGS(problem, fo.stop_criteria.StopFunctionEvaluation(500), x0=[3, 3], starts=4,
+                                   start_design=start_design, seed=0)
+    method.run()
+
+    assert method.start_points.shape == (4, 2)
+    assert np.array_equal(method.start_points[0], [3, 3])
+    assert all(result is not None for result in method.start_results)  # serial: one search after the other
+    assert method.recorder.best_metric <= min(result.fun for result in method.start_results)
+
+
+def test_parallel_basin_hopping():
+    with fo.executors.ExecutorThread(3) as executor:
+        method = fo.methods.MethodBasinHopping(_problem(fo.problems.rastrigin),
+                                               fo.stop_criteria.StopIterationEvaluation(3), x0=[3, 3],
+                                               executor=executor, options=dict(seed=0))
+        method.run()
+        assert method.iteration_count == 3
+        assert set(method.recorder.df["iteration"]) == {0, 1, 2}  # initial minimization, then a hop each
+
+        method = fo.methods.MethodBasinHopping(_problem(fo.problems.rastrigin),
+                                               fo.stop_criteria.StopFunctionEvaluation(100), x0=[3, 3],
+                                               executor=executor, candidates=5, options=dict(seed=0))
+        method.run()
+        assert method.recorder.num_data_points == 100  # stopped in the middle of a hop
+
+
+def test_metropolis():
+    class Result:
+        def __init__(self, fun):
+            self.fun = fun
+
+    rng = np.random.default_rng(0)
+    current = Result(1.0)
+    assert fo.methods.MethodBasinHopping._metropolis(current, [Result(3), Result(0.5), Result(2)], 1, rng).fun == 0.5
+    assert fo.methods.MethodBasinHopping._metropolis(current, [Result(1000)], 1, rng) is current
+    assert fo.methods.MethodBasinHopping._metropolis(current, [Result(1.5)], 0, rng) is current
+
+
+def test_async_bayesian_optimization():
+    pytest.importorskip("dragonfly")
+    evaluated = []
+
+    def func(args) -> float:
+        evaluated.append(list(args))
+        time.sleep(0.01 * (len(evaluated) % 3))  # uneven evaluation times
+        return fo.problems.nd_gaussian(args)
+
+    with fo.executors.ExecutorThread(3) as executor:
+        method = fo.methods.MethodBODragon(_problem(func), fo.stop_criteria.StopFunctionEvaluation(12), init_expts=4,
+                                           executor=executor, asynchronous=True)
+        init_points = [list(point) for point in method._init_points]
+        method.run()
+
+    assert evaluated[:4] == init_points  # initialization design issued in order
+    assert method.recorder.num_data_points == len(evaluated) >= 12  # points in flight at the stop are recorded
+    assert method.optimizer.eval_points_in_progress == []
+
+
+def test_async_bayesian_optimization_serial():
+    pytest.importorskip("dragonfly")
+    with pytest.raises(ValueError, match="asynchronous"):
+        fo.methods.MethodBODragon(_problem(), fo.stop_criteria.StopFunctionEvaluation(12), asynchronous=True)
+
+
+def test_async_bayesian_optimization_unsupported(monkeypatch):
+    pytest.importorskip("dragonfly")
+    from flex_optimization.methods.active_methods import baysian_dragon
+    monkeypatch.setattr(baysian_dragon, "_supports_asynchronous", lambda optimizer: False)
+    with pytest.raises(NotImplementedError, match="Asynchronous mode"):
+        fo.methods.MethodBODragon(_problem(), fo.stop_criteria.StopFunctionEvaluation(12), asynchronous=True,
+                                  executor="thread")
+
+
+def hang_if_negative(args) -> float:
+    if args[0] < 0:
+        time.sleep(60)  # hung simulation
+    return float(args[0])
+
+
+@pytest.mark.parametrize("on_timeout, penalty, expected", [("nan", None, np.nan), ("penalty", 1e6, 1e6),
+                                                          ("requeue", None, np.nan)])
+def test_process_timeout(on_timeout, penalty, expected):
+    problem = fo.Problem(hang_if_negative, [fo.ContinuousVariable(-1, 1, name="x")])
+    start = time.perf_counter()
+    with fo.executors.ExecutorProcess(2, timeout=0.5, on_timeout=on_timeout, penalty=penalty) as executor:
+        method = fo.methods.MethodFactorial(problem, levels=4, executor=executor)
+        method.run()
+        assert executor.timeouts == (4 if on_timeout == "requeue" else 2)
+
+    assert time.perf_counter() - start < 10  # hung workers are killed
+    df = method.recorder.df.sort_values("x")
+    assert np.allclose(df["metric"], [expected, expected, 1 / 3, 1], equal_nan=True)
+
+
+def crash_if_negative(args) -> float:
+    if args[0] < 0:
+        os._exit(1)  # e.g. a segfault in native code
+    return float(args[0])
+
+
+def test_process_crash_recovery():
+    problem = fo.Problem(crash_if_negative, [fo.ContinuousVariable(-1, 1, name="x")])
+    with fo.executors.ExecutorProcess(2, retry=fo.executors.RetryPolicy(2), on_failure="nan") as executor:
+        method = fo.methods.MethodFactorial(problem, levels=4, executor=executor)
+        method.run()
+        assert executor.respawns == 4  # 2 attempts of the 2 negative points
+        assert executor.failures == 2
+
+    df = method.recorder.df
+    failed = sorted(method.recorder.evaluation_status)
+    assert np.all(df["x"].iloc[failed] < 0)
+    assert set(method.recorder.evaluation_status.values()) == {fo.executors.EvaluationStatus.CRASHED}
+    assert np.isclose(method.recorder.best_metric, 1 / 3)  # failed points are never the best
+
+
+def mean_std_fail_if(args) -> tuple:
+    if args[0] in (-1, 1):
+        raise RuntimeError("simulation failed")
+    return float(args[0]), 0.5
+
+
+def difference(mean, std) -> float:
+    return mean - std
+
+
+def test_process_failure_multi_output():
+    problem = fo.Problem(mean_std_fail_if, [fo.ContinuousVariable(-1, 1, name="x")], metric=difference)
+    with fo.executors.ExecutorProcess(2, on_failure="penalty", penalty=1e6) as executor:
+        method = fo.methods.MethodFactorial(problem, levels=4, executor=executor)
+        method.run()
+
+    df = method.recorder.df.sort_values("x")  # the first and last evaluations fail
+    assert sorted(method.recorder.evaluation_status) == [0, 3]
+    assert np.allclose(df["inter_0"], [np.nan, -1 / 3, 1 / 3, np.nan], equal_nan=True)
+    assert np.allclose(df["inter_1"], [np.nan, 0.5, 0.5, np.nan], equal_nan=True)
+    assert np.allclose(df["metric"], [1e6, -1 / 3 - 0.5, 1 / 3 - 0.5, 1e6])
+
+
+def _break_pipe(executor):
+    """ The next 'send' to the first worker fails as if it had just died. """
+    connection = executor._workers[0].connection
+
+    def send(obj):
+        raise BrokenPipeError
+
+    connection.send = send
+
+
+@pytest.mark.parametrize("retry", [None, fo.executors.RetryPolicy(2)])
+def test_process_send_to_dead_worker(retry):
+    problem = fo.Problem(hang_if_negative, [fo.ContinuousVariable(-1, 1, name="x")])
+    with fo.executors.ExecutorProcess(2, retry=retry) as executor:
+        executor.start(problem)
+        _break_pipe(executor)
+        if retry is None:
+            with pytest.raises(fo.executors.WorkerCrashed):
+                executor.map([[0.0], [0.5]])
+        else:
+            assert executor.map([[0.0], [0.5]]) == [0.0, 0.5]  # re-queued on a new worker
+        assert executor.respawns == 1
+        assert executor.map([[1.0]]) == [1.0]  # the manager thread is still running
+
+
+def fail_first_attempt(args) -> float:
+    marker = os.path.join(os.environ["FLEX_OPTIMIZATION_TEST_DIR"], f"{args[0]:.6f}")
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        raise RuntimeError("transient failure")
+    return float(args[0])
+
+
+def test_process_retry(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLEX_OPTIMIZATION_TEST_DIR", str(tmp_path))
+    problem = fo.Problem(fail_first_attempt, [fo.ContinuousVariable(-1, 1, name="x")])
+    retry = fo.executors.RetryPolicy(3, backoff=0.01, exceptions=(RuntimeError,))
+    with fo.executors.ExecutorProcess(2, retry=retry) as executor:
+        method = fo.methods.MethodFactorial(problem, levels=4, executor=executor)
+        method.run()
+        assert executor.failures == 0
+
+    assert method.recorder.evaluation_status == {}
+    assert np.allclose(np.sort(method.recorder.df["metric"]), [-1, -1 / 3, 1 / 3, 1])
+
+
+def fail_first_attempt_then_hang_if_negative(args) -> float:
+    fail_first_attempt(args)
+    return hang_if_negative(args)
+
+
+def test_process_timeout_requeue_after_retry(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLEX_OPTIMIZATION_TEST_DIR", str(tmp_path))
+    problem = fo.Problem(fail_first_attempt_then_hang_if_negative, [fo.ContinuousVariable(-1, 1, name="x")])
+    retry = fo.executors.RetryPolicy(3, exceptions=(RuntimeError,))
+    with fo.executors.ExecutorProcess(2, timeout=0.5, on_timeout="requeue", retry=retry) as executor:
+        method = fo.methods.MethodFactorial(problem, levels=4, executor=executor)
+        method.run()
+        assert executor.timeouts == 4  # a retried point is still requeued once after timing out
+
+    assert set(method.recorder.evaluation_status.values()) == {fo.executors.EvaluationStatus.TIMEOUT}
+
+
+class SimulationError(Exception):
+    pass
+
+
+def always_fail(args) -> float:
+    raise SimulationError(f"simulation failed at {args[0]}")
+
+
+def test_process_failure_raises():
+    problem = fo.Problem(always_fail, [fo.ContinuousVariable(-1, 1, name="x")])
+    with fo.executors.ExecutorProcess(2) as executor:  # on_failure="raise"
+        method = fo.methods.MethodFactorial(problem, levels=4, executor=executor)
+        with pytest.raises(SimulationError, match="simulation failed"):
+            method.run()
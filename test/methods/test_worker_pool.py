@@ -0,0 +1,35 @@
+import os
+
+import flex_optimization as fo
+from flex_optimization.core.worker_pool import WorkerPool
+
+
+def worker_pid(args) -> float:
+    return os.getpid()
+
+
+def _problem():
+    return fo.Problem(
+        func=worker_pid,
+        variables=[fo.ContinuousVariable(-5, 5, name="x"), fo.ContinuousVariable(-5, 5, name="y")]
+    )
+
+
+def test_shared_worker_pool():
+    problem = _problem()
+    with WorkerPool(2) as pool:
+        assert isinstance(pool, fo.executors.ExecutorProcess) and pool.processes == 2
+        method = fo.methods.MethodFactorial(problem, levels=4, multiprocess=pool)
+        method.run()
+        pids = {worker.process.pid for worker in pool._workers}
+        assert set(method.recorder.df["metric"]) <= pids
+
+        method = fo.methods.MethodSobol(problem, fo.stop_criteria.StopFunctionEvaluation(16), seed=0,
+                                        multiprocess=pool)
+        method.run_steps(16)
+        assert method.recorder.num_data_points == 16
+        assert set(method.recorder.df["metric"]) <= pids  # same warm workers
+        method.close()
+        assert pool.running  # a shared pool isn't closed by the method
+
+    assert not pool.running
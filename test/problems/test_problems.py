@@ -35,3 +35,11 @@ def test_nparray_input2(problem: Callable):
     result = problem(args)
     assert len(result.shape) == 1
     assert result.shape[0] == n
+
+
+@pytest.mark.parametrize("problem", problems)
+def test_batch_matches_single(problem: Callable):
+    points = np.random.default_rng(0).uniform(-5, 5, (20, 8))
+    result = problem(points)
+    assert result.shape == (20,)
+    assert np.allclose(result, [problem(list(point)) for point in points])